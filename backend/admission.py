@@ -0,0 +1,255 @@
+"""
+Admission Control - Adaptive concurrency limit for upstream-backed routes
+Caps in-flight chat requests, queues the overflow by priority with a
+deadline, and sheds requests that could not be answered within the client's
+timeout; the cap adapts to observed latency
+"""
+
+import os
+import math
+import time
+import heapq
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Collection, Dict, List, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from metrics import ADMISSION_DECISIONS, ADMISSION_QUEUE_WAIT
+
+
+# Above the upstream concurrency cap (GROQ_MAX_CONCURRENCY), so cached and
+# precomputed answers are not queued behind requests waiting on the upstream
+ADMISSION_INITIAL_LIMIT = int(os.environ.get("ADMISSION_INITIAL_LIMIT", "32"))
+ADMISSION_MIN_LIMIT = int(os.environ.get("ADMISSION_MIN_LIMIT", "2"))
+ADMISSION_MAX_LIMIT = int(os.environ.get("ADMISSION_MAX_LIMIT", "64"))
+ADMISSION_MAX_QUEUE = int(os.environ.get("ADMISSION_MAX_QUEUE", "100"))
+# Requests slower than this shrink the limit; faster ones let it grow
+ADMISSION_LATENCY_TARGET = float(os.environ.get("ADMISSION_LATENCY_TARGET", "5"))
+# The frontend gives up after 30s; a request that can't finish by then is shed up front
+ADMISSION_CLIENT_TIMEOUT = float(os.environ.get("ADMISSION_CLIENT_TIMEOUT", "30"))
+LATENCY_EWMA_ALPHA = 0.2
+# Cap on the smoothed service time as a share of the client timeout, so a
+# run of slow requests leaves queued ones some budget instead of shedding all
+MAX_SERVICE_TIME_FRACTION = 0.5
+LIMIT_DECREASE_FACTOR = 0.9
+
+
+class Overloaded(Exception):
+    """Raised when a request is shed instead of admitted"""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    future: asyncio.Future = field(compare=False)
+
+
+class AdmissionController:
+    """
+    Concurrency limit with a bounded priority queue
+
+    Requests beyond `limit` wait in a heap ordered by priority (lower first),
+    then arrival. A request is shed immediately when the queue is full or
+    its expected wait plus service time exceeds the client timeout, and
+    while queued once that deadline passes.
+
+    The limit follows AIMD on request latency (time to first byte, see
+    AdmissionMiddleware): it shrinks by
+    LIMIT_DECREASE_FACTOR (at most once per smoothed latency interval) when
+    a request takes longer than the target, and grows by about one per
+    `limit` fast completions while the limit is actually reached.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = ADMISSION_INITIAL_LIMIT,
+        min_limit: int = ADMISSION_MIN_LIMIT,
+        max_limit: int = ADMISSION_MAX_LIMIT,
+        max_queue: int = ADMISSION_MAX_QUEUE,
+        latency_target: float = ADMISSION_LATENCY_TARGET,
+        client_timeout: float = ADMISSION_CLIENT_TIMEOUT
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.max_queue = max_queue
+        self.latency_target = latency_target
+        self.client_timeout = client_timeout
+        self.in_flight = 0
+        self.queued = 0
+        self.latency: Optional[float] = None
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._last_decrease = 0.0
+
+    @property
+    def service_time(self) -> float:
+        """Smoothed time an admitted request holds its slot"""
+        latency = self.latency if self.latency is not None else self.latency_target
+        return min(latency, self.client_timeout * MAX_SERVICE_TIME_FRACTION)
+
+    def expected_wait(self, priority: int) -> float:
+        """Seconds until a new request of this priority would be admitted"""
+        if self.in_flight < int(self.limit) and not self.queued:
+            return 0.0
+        ahead = sum(1 for waiter in self._waiters if waiter.priority <= priority and not waiter.future.done())
+        # Slots free up at roughly limit / service_time per second
+        return (ahead + 1) * self.service_time / max(int(self.limit), 1)
+
+    def _shed(self, reason: str, retry_after: float) -> Overloaded:
+        ADMISSION_DECISIONS.inc(result=reason)
+        return Overloaded(reason, retry_after)
+
+    async def acquire(self, priority: int = 0) -> None:
+        """
+        Wait for a slot
+
+        Raises:
+            Overloaded: the request was shed; retry_after estimates when
+                capacity should be available again
+        """
+        if self.in_flight < int(self.limit) and not self.queued:
+            self.in_flight += 1
+            ADMISSION_DECISIONS.inc(result="admitted")
+            return
+
+        wait = self.expected_wait(priority)
+        if self.queued >= self.max_queue:
+            raise self._shed("queue_full", wait)
+        budget = self.client_timeout - self.service_time
+        if wait > budget:
+            raise self._shed("expected_wait", wait)
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, _Waiter(priority, next(self._seq), future))
+        self.queued += 1
+        started = time.monotonic()
+        # asyncio.wait rather than wait_for: on 3.11 wait_for swallows a
+        # cancellation that races with the handover, admitting a gone client
+        try:
+            await asyncio.wait((future,), timeout=max(budget, 0.001))
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before the client went away
+            if future.done():
+                self.release(None)
+            else:
+                future.cancel()
+            raise
+        finally:
+            self.queued -= 1
+            ADMISSION_QUEUE_WAIT.observe(time.monotonic() - started)
+        if not future.done():
+            future.cancel()
+            raise self._shed("deadline", self.expected_wait(priority))
+        ADMISSION_DECISIONS.inc(result="queued")
+
+    def release(self, latency: Optional[float]) -> None:
+        """
+        Free a slot and hand it to the next waiter
+
+        Args:
+            latency: Seconds the request held its slot, or None if it did
+                not complete normally (not used to adapt the limit)
+        """
+        self.in_flight -= 1
+        if latency is not None:
+            self._adapt(latency)
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = heapq.heappop(self._waiters)
+            if not waiter.future.done():
+                waiter.future.set_result(None)
+                self.in_flight += 1
+
+    def _adapt(self, latency: float) -> None:
+        self.latency = latency if self.latency is None else (
+            LATENCY_EWMA_ALPHA * latency + (1 - LATENCY_EWMA_ALPHA) * self.latency
+        )
+        now = time.monotonic()
+        if latency > self.latency_target:
+            if now - self._last_decrease >= self.latency:
+                self.limit = max(self.min_limit, self.limit * LIMIT_DECREASE_FACTOR)
+                self._last_decrease = now
+        elif self.in_flight + 1 >= int(self.limit):
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None
+        }
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware applying an AdmissionController to selected POST routes
+
+    Other routes (static data, health, metrics) never wait for a slot. The
+    slot is held until the response body has been fully sent, so streamed
+    chats count for their whole duration, but the limit adapts to the time
+    to the first body chunk: that is the upstream latency for both plain
+    and streamed answers, while a stream's length depends on the answer.
+    Routes in `unmeasured` (batches, whose time grows with their size)
+    hold slots without adapting the limit. The admission time is stored as
+    `admitted_at` in the request state.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: AdmissionController,
+        priorities: Dict[str, int],
+        unmeasured: Collection[str] = ()
+    ):
+        self.app = app
+        self.controller = controller
+        self.priorities = priorities
+        self.unmeasured = frozenset(unmeasured)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        priority = self.priorities.get(scope["path"]) if scope["type"] == "http" else None
+        if priority is None or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.controller.acquire(priority)
+        except Overloaded as e:
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "The AI assistant is busy right now. Please try again shortly."},
+                headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+            )
+            await response(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        # Lets handlers time body read and validation apart from the queue wait
+        scope.setdefault("state", {})["admitted_at"] = started
+        first_byte: Optional[float] = None
+
+        async def send_timed(message: Message) -> None:
+            nonlocal first_byte
+            if first_byte is None and message["type"] == "http.response.body" and message.get("body"):
+                first_byte = time.perf_counter()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_timed)
+        except BaseException:
+            self.controller.release(None)
+            raise
+        if scope["path"] in self.unmeasured:
+            self.controller.release(None)
+        else:
+            self.controller.release((first_byte or time.perf_counter()) - started)
@@ -4,8 +4,12 @@ Handles all AI-related functionality for the portfolio chat assistant
 """
 
 import os
-from groq import Groq
-from typing import List, Dict
+import time
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, List, Dict, Optional, Sequence
 
 # Try to load .env for local development
 try:
@@ -14,37 +18,245 @@ try:
 except ImportError:
     pass
 
-from portfolio_data import PORTFOLIO_DATA
+from content_store import content_store, portfolio_fingerprint
+from response_cache import ResponseCache, normalize_message
+from retrieval import PortfolioRetriever, estimate_tokens, tokenize
+from history import compact_history
+from resilience import CircuitBreaker, call_with_retries, is_transient_error
+from singleflight import SingleFlight
+from model_router import ModelRouter, Route, direct_answer
+from answer_index import AnswerIndex, generate_suggested_questions
+from shared_state import SharedCache
+from grounding import GroundingChecker, GroundingJob, GroundingReport
+from metrics import (
+    CHAT_ANSWERS, CHAT_ROUTES, PROMPT_BUILD_DURATION, UPSTREAM_DURATION, UPSTREAM_TTFT,
+    Timer, record_timing, record_usage
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Upstream connection settings (override via environment)
+GROQ_MAX_CONCURRENCY = int(os.environ.get("GROQ_MAX_CONCURRENCY", "16"))
+GROQ_MAX_CONNECTIONS = int(os.environ.get("GROQ_MAX_CONNECTIONS", "32"))
+GROQ_KEEPALIVE_CONNECTIONS = int(os.environ.get("GROQ_KEEPALIVE_CONNECTIONS", "16"))
+GROQ_CONNECT_TIMEOUT = float(os.environ.get("GROQ_CONNECT_TIMEOUT", "5"))
+GROQ_REQUEST_TIMEOUT = float(os.environ.get("GROQ_REQUEST_TIMEOUT", "25"))
+
+# Upstream resilience: retries, per-attempt and total deadlines, circuit breaker
+GROQ_RETRY_ATTEMPTS = int(os.environ.get("GROQ_RETRY_ATTEMPTS", "3"))
+GROQ_ATTEMPT_TIMEOUT = float(os.environ.get("GROQ_ATTEMPT_TIMEOUT", "12"))
+GROQ_TOTAL_DEADLINE = float(os.environ.get("GROQ_TOTAL_DEADLINE", "25"))
+GROQ_BREAKER_THRESHOLD = int(os.environ.get("GROQ_BREAKER_THRESHOLD", "5"))
+GROQ_BREAKER_RESET = float(os.environ.get("GROQ_BREAKER_RESET", "30"))
+
+# Response cache settings
+CHAT_CACHE_MAX_ENTRIES = int(os.environ.get("CHAT_CACHE_MAX_ENTRIES", "512"))
+CHAT_CACHE_MAX_BYTES = int(os.environ.get("CHAT_CACHE_MAX_BYTES", str(2 * 1024 * 1024)))
+CHAT_CACHE_TTL = float(os.environ.get("CHAT_CACHE_TTL", "3600"))
+# Near-duplicate matching is opt-in (e.g. 0.9); 0 serves exact matches only
+CHAT_CACHE_SIMILARITY = float(os.environ.get("CHAT_CACHE_SIMILARITY", "0"))
+
+# Token budget for the conversation history sent upstream with each question
+HISTORY_TOKEN_BUDGET = int(os.environ.get("HISTORY_TOKEN_BUDGET", "1500"))
+
+# Retrieved portfolio context injected per question
+RETRIEVAL_TOP_K = int(os.environ.get("RETRIEVAL_TOP_K", "4"))
+RETRIEVAL_TOKEN_BUDGET = int(os.environ.get("RETRIEVAL_TOKEN_BUDGET", "1000"))
+
+# Precomputed suggested-question answers: regenerated this often, retried
+# sooner when a warm-up could not answer every question
+ANSWER_REFRESH_INTERVAL = float(os.environ.get("ANSWER_REFRESH_INTERVAL", str(6 * 3600)))
+ANSWER_RETRY_INTERVAL = float(os.environ.get("ANSWER_RETRY_INTERVAL", "60"))
+ANSWER_WARM_CONCURRENCY = 2
+
+# Questions of one batch answered at the same time (upstream calls are also
+# bounded process-wide by GROQ_MAX_CONCURRENCY)
+CHAT_BATCH_CONCURRENCY = int(os.environ.get("CHAT_BATCH_CONCURRENCY", "4"))
+
+
+class AIServiceNotConfigured(RuntimeError):
+    """Raised when a chat is attempted without GROQ_API_KEY set"""
+
+
+class UpstreamUnavailable(RuntimeError):
+    """Raised when the upstream can't answer now (circuit open, or transient errors after retries)"""
+
+
+@dataclass(frozen=True)
+class BatchAnswer:
+    """Outcome of one question in a batch; exactly one of response and error is set"""
+    index: int
+    question: str
+    response: Optional[str] = None
+    error: Optional[str] = None
 
 
 class AIService:
     def __init__(self):
-        """Initialize Groq client with API key from environment"""
-        api_key = os.environ.get("GROQ_API_KEY")
-        if not api_key:
-            raise ValueError("GROQ_API_KEY environment variable is required")
-        self.client = Groq(api_key=api_key)
-        self.model = "llama-3.3-70b-versatile"
-        
-    def build_system_prompt(self) -> str:
-        """Build a comprehensive system prompt with portfolio context"""
-        bio = PORTFOLIO_DATA["bio"]
-        
-        # Format experience
+        """
+        Set up prompt, caches and resilience state
+        
+        The Groq SDK import and HTTP client construction are deferred to
+        first use (or to warm_up()), so importing this module stays cheap
+        and the app can serve static routes without GROQ_API_KEY.
+        """
+        self.api_key = os.environ.get("GROQ_API_KEY")
+        self.http_client = None
+        self._client = None
+        self._client_lock = threading.Lock()
+
+        # Chooses the model per question from its complexity and model health
+        self.router = ModelRouter()
+
+        # Caps the number of concurrent upstream calls from this process
+        self.upstream_semaphore = asyncio.Semaphore(GROQ_MAX_CONCURRENCY)
+
+        # Identical concurrent questions share one upstream call
+        self.inflight = SingleFlight()
+
+        # Fails fast to a local fallback answer while the upstream is unhealthy
+        self.breaker = CircuitBreaker(
+            failure_threshold=GROQ_BREAKER_THRESHOLD,
+            reset_timeout=GROQ_BREAKER_RESET
+        )
+
+        # Answers to repeated questions, keyed on prompt version and history
+        self.response_cache = ResponseCache(
+            max_entries=CHAT_CACHE_MAX_ENTRIES,
+            max_bytes=CHAT_CACHE_MAX_BYTES,
+            ttl_seconds=CHAT_CACHE_TTL,
+            similarity_threshold=CHAT_CACHE_SIMILARITY
+        )
+
+        # Suggested questions and their precomputed answers, regenerated in
+        # the background whenever the prompt version changes
+        self.suggested_questions: List[str] = []
+        self.answer_index = AnswerIndex()
+        self._answers_stale = asyncio.Event()
+        # Set in multi-worker mode so one worker's precomputed answers are reused by the others
+        self.shared_answers: Optional[SharedCache] = None
+
+        # Upstream answers are checked against the portfolio data in the
+        # background (see check_answers); ungrounded ones leave the cache
+        self.grounding = GroundingChecker()
+
+        # System prompt and retrieval index are built once and versioned by
+        # the data they came from
+        self.portfolio_data: Dict = content_store.current.data
+        self.system_prompt: Optional[str] = None
+        self.prompt_version: Optional[str] = None
+        self.retriever: Optional[PortfolioRetriever] = None
+        self.refresh_system_prompt()
+
+    @property
+    def configured(self) -> bool:
+        """True if an API key is available"""
+        return bool(self.api_key)
+
+    @property
+    def ready(self) -> bool:
+        """True once the upstream client has been constructed"""
+        return self._client is not None
+
+    @property
+    def client(self):
+        """The async Groq client, constructed on first access"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+
+    def _create_client(self):
+        """Import the Groq SDK and build a client on a pooled HTTP connection"""
+        if not self.api_key:
+            raise AIServiceNotConfigured("GROQ_API_KEY environment variable is required")
+        
+        import httpx
+        from groq import AsyncGroq
+        
+        # One pooled HTTP client shared by every chat request so connections
+        # (and their TLS sessions) are reused instead of re-established
+        timeout = httpx.Timeout(GROQ_REQUEST_TIMEOUT, connect=GROQ_CONNECT_TIMEOUT)
+        self.http_client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=GROQ_MAX_CONNECTIONS,
+                max_keepalive_connections=GROQ_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        return AsyncGroq(
+            api_key=self.api_key,
+            timeout=timeout,
+            max_retries=0,  # Retries are handled by call_with_retries
+            http_client=self.http_client,
+        )
+
+    async def warm_up(self) -> None:
+        """Construct the upstream client off the event loop"""
+        if self.configured and not self.ready:
+            await asyncio.to_thread(lambda: self.client)
+
+    async def close(self) -> None:
+        """Close the pooled upstream HTTP client, if it was created"""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+            self.http_client = None
+        
+    def refresh_system_prompt(self, data: Optional[Dict] = None) -> bool:
+        """
+        Rebuild the cached system prompt and retrieval index if the portfolio data changed
+
+        Args:
+            data: Portfolio data to build from (defaults to the current content)
+
+        Returns:
+            True if the prompt was rebuilt, False if the cached one is current
+        """
+        data = content_store.current.data if data is None else data
+        version = portfolio_fingerprint(data)
+        if version == self.prompt_version and self.system_prompt is not None:
+            return False
+
+        self.portfolio_data = data
+        self.system_prompt = self.build_system_prompt(data)
+        self.retriever = PortfolioRetriever(data)
+        self.prompt_version = version
+        # Cached answers were generated from the old prompt
+        self.response_cache.clear()
+        self.grounding.rebuild(data, version)
+        self.suggested_questions = generate_suggested_questions(data)
+        self.answer_index.reset(version, self.suggested_questions)
+        self._answers_stale.set()
+        return True
+
+    def build_system_prompt(self, data: Optional[Dict] = None) -> str:
+        """
+        Build the static system prompt with a compact portfolio overview
+
+        Detailed project, experience and testimonial text is not included here;
+        it is retrieved per question by build_context_prompt.
+        """
+        data = content_store.current.data if data is None else data
+        bio = data["bio"]
+        
+        # Format experience overview
         experience_text = "\n".join([
-            f"- {exp['role']} at {exp['company']} ({exp['period']}): {exp['description']}"
-            for exp in PORTFOLIO_DATA["experience"]
+            f"- {exp['role']} at {exp['company']} ({exp['period']})"
+            for exp in data["experience"]
         ])
         
-        # Format projects
+        # Format projects overview
         projects_text = "\n".join([
-            f"- {proj['title']}: {proj['shortDesc']} Technologies: {', '.join(proj['tech'])}. {proj['highlights']}"
-            for proj in PORTFOLIO_DATA["projects"]
+            f"- {proj['title']} (Technologies: {', '.join(proj['tech'])})"
+            for proj in data["projects"]
         ])
         
         # Format skills
         all_skills = []
-        for category, skills in PORTFOLIO_DATA["skills"].items():
+        for category, skills in data["skills"].items():
             all_skills.extend(skills)
         skills_text = ", ".join(all_skills)
         
@@ -59,10 +271,10 @@ Email: {bio['email']}
 LinkedIn: {bio['linkedin']}
 GitHub: {bio['github']}
 
-WORK EXPERIENCE:
+WORK EXPERIENCE (overview):
 {experience_text}
 
-PROJECTS:
+PROJECTS (overview):
 {projects_text}
 
 TECHNICAL SKILLS:
@@ -72,7 +284,7 @@ INSTRUCTIONS:
 1. Answer questions about {bio['name']}'s skills, projects, experience, and capabilities
 2. Be professional, friendly, and concise in your responses
 3. When asked about specific technologies, mention relevant projects that use them
-4. If asked about project details, provide information from the context above
+4. If asked about project details, provide information from the RELEVANT PORTFOLIO DETAILS provided with the question
 5. If asked something you don't know, politely admit it and suggest the visitor contact {bio['name']} directly
 6. Don't make up information - only use the context provided
 7. Highlight relevant projects when visitors ask about specific technologies or use cases
@@ -91,72 +303,510 @@ Remember: You represent {bio['name']} professionally. Be helpful, honest, and en
 
         return system_prompt
     
+    def build_context_prompt(
+        self,
+        user_message: str,
+        conversation_history: List[Dict[str, str]]
+    ) -> Optional[str]:
+        """Retrieve the portfolio sections relevant to the question, within the token budget"""
+        # Include the previous user turn so follow-ups ("tell me more") keep their topic
+        query = user_message
+        for msg in reversed(conversation_history):
+            if msg["role"] == "user":
+                query = f"{user_message} {msg['content']}"
+                break
+        
+        chunks = self.retriever.retrieve(
+            query,
+            top_k=RETRIEVAL_TOP_K,
+            token_budget=RETRIEVAL_TOKEN_BUDGET
+        )
+        if not chunks:
+            return None
+        return "RELEVANT PORTFOLIO DETAILS:\n\n" + "\n\n".join(chunk.text for chunk in chunks)
+
+    def build_messages(
+        self,
+        user_message: str,
+        conversation_history: List[Dict[str, str]]
+    ) -> List[Dict[str, str]]:
+        """
+        Construct the upstream messages array around the cached system prompt
+        
+        conversation_history is expected to be compacted already (see
+        compact_history) and is appended as-is.
+        """
+        messages = [
+            {"role": "system", "content": self.system_prompt}
+        ]
+        
+        # Retrieved context goes in its own message so the static prompt
+        # prefix stays identical across requests
+        context_prompt = self.build_context_prompt(user_message, conversation_history)
+        if context_prompt:
+            messages.append({"role": "system", "content": context_prompt})
+        
+        messages.extend(conversation_history)
+        
+        # Add current user message
+        messages.append({
+            "role": "user",
+            "content": user_message
+        })
+        return messages
+
+    def route_messages(self, user_message: str, messages: List[Dict[str, str]]) -> Route:
+        """Pick the model and completion cap for an assembled prompt"""
+        prompt_tokens = sum(estimate_tokens(msg["content"]) for msg in messages)
+        route = self.router.route(user_message, prompt_tokens)
+        CHAT_ROUTES.inc(model=route.model, tier=route.tier)
+        return route
+
+    def build_fallback_response(self, user_message: str) -> str:
+        """
+        Answer from portfolio data alone, used when the upstream is unavailable
+        
+        Matches the question against projects, experience and skills via the
+        retrieval index, so no model call is needed.
+        """
+        data = self.portfolio_data
+        bio = data["bio"]
+        projects = {str(proj["id"]): proj for proj in data["projects"]}
+        experience = {str(exp["id"]): exp for exp in data["experience"]}
+        
+        matched_projects, matched_experience = [], []
+        for index, _ in self.retriever.score(user_message):
+            chunk = self.retriever.chunks[index]
+            if chunk.kind == "project" and len(matched_projects) < 3:
+                matched_projects.append(projects[chunk.key])
+            elif chunk.kind == "experience" and len(matched_experience) < 2:
+                matched_experience.append(experience[chunk.key])
+        
+        query_terms = set(tokenize(user_message))
+        matched_skills = [
+            skill
+            for skills in data["skills"].values()
+            for skill in skills
+            if query_terms & set(tokenize(skill))
+        ]
+        
+        parts = [
+            "I'm having trouble reaching my AI model right now, so here's a quick answer from "
+            f"{bio['name']}'s portfolio."
+        ]
+        if matched_projects:
+            parts.append("Relevant projects: " + "; ".join(
+                f"{proj['title']} - {proj['shortDesc']}" for proj in matched_projects
+            ))
+        if matched_experience:
+            parts.append("Related experience: " + "; ".join(
+                f"{exp['role']} at {exp['company']} ({exp['period']})" for exp in matched_experience
+            ))
+        if matched_skills:
+            parts.append("Matching skills: " + ", ".join(matched_skills[:8]) + ".")
+        if len(parts) == 1:
+            parts.append(f"{bio['name']} is a {bio['title']} based in {bio['location']}. {bio['summary']}")
+        parts.append(f"For more details, reach out at {bio['email']}.")
+        return "\n\n".join(parts)
+
+    async def _create_completion(self, messages: List[Dict[str, str]], route: Route):
+        """Single non-streaming upstream attempt, bounded by the concurrency cap"""
+        async with self.upstream_semaphore:
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                response = await self.client.chat.completions.create(
+                    model=route.model,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=route.max_tokens,
+                    top_p=1,
+                    stream=False
+                )
+                outcome = "success"
+                return response
+            finally:
+                elapsed = time.perf_counter() - started
+                UPSTREAM_DURATION.observe(elapsed, model=route.model, mode="complete", outcome=outcome)
+                record_timing("upstream_ms", elapsed)
+                self.router.record(route.model, elapsed, outcome == "success")
+
     async def get_ai_response(
         self, 
         user_message: str, 
-        conversation_history: List[Dict[str, str]]
+        conversation_history: Sequence[Any],
+        fallback: bool = True
     ) -> str:
         """
         Get AI response from Groq API
         
         Args:
             user_message: The user's current message
-            conversation_history: List of previous messages in format 
+            conversation_history: Previous messages, either in format
                                 [{"role": "user", "content": "..."}, ...]
+                                or as Message models; compacted to
+                                HISTORY_TOKEN_BUDGET before use
+            fallback: Answer from portfolio data when the upstream is failing
         
         Returns:
-            AI assistant's response as a string
+            AI assistant's response as a string. If the upstream is failing
+            (circuit open or transient errors after retries), a fallback
+            answer built from portfolio data is returned instead. Contact
+            questions are answered from the bio without a model call.
+        
+        Raises:
+            UpstreamUnavailable: the upstream is failing and fallback is False
         """
+        if not self.configured:
+            raise AIServiceNotConfigured("GROQ_API_KEY environment variable is required")
+        
+        answer = direct_answer(user_message, self.portfolio_data)
+        if answer is not None:
+            CHAT_ANSWERS.inc(source="direct")
+            return answer
+        
+        recent_history = compact_history(conversation_history, HISTORY_TOKEN_BUDGET)
+        # Read once: the content may reload while the upstream call is in
+        # flight, and the answer must be filed under the prompt it came from
+        version = self.prompt_version
+        if not recent_history:
+            precomputed = self.answer_index.get(user_message, version)
+            if precomputed is not None:
+                CHAT_ANSWERS.inc(source="precomputed")
+                return precomputed
+        
+        cached = self.response_cache.get(user_message, recent_history, version)
+        if cached is not None:
+            CHAT_ANSWERS.inc(source="cache")
+            return cached
+        
+        # Concurrent requests for the same question, history and prompt
+        # version await a single upstream call
+        key, _, _ = ResponseCache.make_key(user_message, recent_history, version)
         try:
-            # Build the system prompt
-            system_prompt = self.build_system_prompt()
-            
-            # Construct messages array
-            messages = [
-                {"role": "system", "content": system_prompt}
-            ]
-            
-            # Add conversation history (limit to last 10 messages)
-            for msg in conversation_history[-10:]:
-                messages.append({
-                    "role": msg["role"],
-                    "content": msg["content"]
-                })
-            
-            # Add current user message
-            messages.append({
-                "role": "user",
-                "content": user_message
-            })
+            return await self.inflight.do(
+                key,
+                lambda: self._fetch_ai_response(user_message, recent_history, version)
+            )
+        except UpstreamUnavailable:
+            if not fallback:
+                raise
+            CHAT_ANSWERS.inc(source="fallback")
+            return self.build_fallback_response(user_message)
+
+    async def _fetch_ai_response(
+        self,
+        user_message: str,
+        recent_history: List[Dict[str, str]],
+        version: str
+    ) -> str:
+        """
+        Call the upstream (with retries and circuit breaking) and cache the answer
+        under the prompt version the request was looked up with
+        
+        Raises:
+            UpstreamUnavailable: the circuit is open or transient errors
+                outlasted the retries; each caller decides on a fallback
+        """
+        if not self.breaker.allow():
+            raise UpstreamUnavailable("AI service unavailable: upstream circuit open")
+        
+        try:
+            with Timer() as timer:
+                messages = self.build_messages(user_message, recent_history)
+                route = self.route_messages(user_message, messages)
+            PROMPT_BUILD_DURATION.observe(timer.elapsed)
+            record_timing("prompt_build_ms", timer.elapsed)
             
-            # Call Groq API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=1024,
-                top_p=1,
-                stream=False
+            # Call Groq API without blocking the event loop
+            response = await call_with_retries(
+                lambda: self._create_completion(messages, route),
+                attempts=GROQ_RETRY_ATTEMPTS,
+                attempt_timeout=GROQ_ATTEMPT_TIMEOUT,
+                deadline=GROQ_TOTAL_DEADLINE
             )
+            self.breaker.record_success()
+            record_usage(route.model, getattr(response, "usage", None))
+            CHAT_ANSWERS.inc(source="upstream")
             
-            # Extract and return response
-            return response.choices[0].message.content
+            # Extract, cache and return response
+            content = response.choices[0].message.content
+            self.response_cache.set(user_message, recent_history, version, content)
+            self.grounding.submit(GroundingJob(user_message, content, version, tuple(recent_history)))
+            return content
             
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
         except Exception as e:
-            print(f"Error calling Groq API: {str(e)}")
+            logger.error("Error calling Groq API: %s", e)
+            if is_transient_error(e):
+                self.breaker.record_failure()
+                raise UpstreamUnavailable(f"AI service unavailable: {str(e) or type(e).__name__}")
+            self.breaker.release()
             raise Exception(f"AI service error: {str(e)}")
+
+    async def stream_ai_response(
+        self,
+        user_message: str,
+        conversation_history: Sequence[Any]
+    ) -> AsyncIterator[str]:
+        """
+        Stream AI response tokens from Groq API as they are generated
+        
+        Args:
+            user_message: The user's current message
+            conversation_history: List of previous messages (same format as get_ai_response)
+        
+        Yields:
+            Response text deltas in generation order. If the upstream fails
+            before the first token, the fallback answer is yielded instead.
+        
+        Closing the generator early (e.g. the client disconnected) closes the
+        upstream stream so no further tokens are generated or billed.
+        """
+        if not self.configured:
+            raise AIServiceNotConfigured("GROQ_API_KEY environment variable is required")
+        
+        answer = direct_answer(user_message, self.portfolio_data)
+        if answer is not None:
+            CHAT_ANSWERS.inc(source="direct")
+            yield answer
+            return
+        
+        recent_history = compact_history(conversation_history, HISTORY_TOKEN_BUDGET)
+        # Read once, before the stream: see get_ai_response
+        version = self.prompt_version
+        if not recent_history:
+            precomputed = self.answer_index.get(user_message, version)
+            if precomputed is not None:
+                CHAT_ANSWERS.inc(source="precomputed")
+                yield precomputed
+                return
+        
+        cached = self.response_cache.get(user_message, recent_history, version)
+        if cached is not None:
+            CHAT_ANSWERS.inc(source="cache")
+            yield cached
+            return
+        
+        if not self.breaker.allow():
+            CHAT_ANSWERS.inc(source="fallback")
+            yield self.build_fallback_response(user_message)
+            return
+        
+        with Timer() as timer:
+            messages = self.build_messages(user_message, recent_history)
+            route = self.route_messages(user_message, messages)
+        PROMPT_BUILD_DURATION.observe(timer.elapsed)
+        record_timing("prompt_build_ms", timer.elapsed)
+        chunks = []
+        ttft = None
+        outcome = "error"
+        usage = None
+        
+        try:
+            async with self.upstream_semaphore:
+                started = time.perf_counter()
+                # Retries only cover opening the stream; once tokens have been
+                # sent to the client a failure can't be transparently retried
+                stream = await call_with_retries(
+                    lambda: self.client.chat.completions.create(
+                        model=route.model,
+                        messages=messages,
+                        temperature=0.7,
+                        max_tokens=route.max_tokens,
+                        top_p=1,
+                        stream=True
+                    ),
+                    attempts=GROQ_RETRY_ATTEMPTS,
+                    attempt_timeout=GROQ_ATTEMPT_TIMEOUT,
+                    deadline=GROQ_TOTAL_DEADLINE
+                )
+                try:
+                    async for chunk in stream:
+                        # Groq reports usage on the final chunk under x_groq
+                        x_groq = getattr(chunk, "x_groq", None)
+                        usage = getattr(x_groq, "usage", None) or getattr(chunk, "usage", None) or usage
+                        if not chunk.choices:
+                            continue
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            if not chunks:
+                                ttft = time.perf_counter() - started
+                                UPSTREAM_TTFT.observe(ttft, model=route.model)
+                                record_timing("ttft_ms", ttft)
+                            chunks.append(delta)
+                            yield delta
+                    outcome = "success"
+                except (asyncio.CancelledError, GeneratorExit):
+                    # The client went away; says nothing about the model
+                    outcome = "cancelled"
+                    raise
+                finally:
+                    await stream.close()
+                    if outcome != "cancelled":
+                        elapsed = time.perf_counter() - started
+                        UPSTREAM_DURATION.observe(elapsed, model=route.model, mode="stream", outcome=outcome)
+                        record_timing("upstream_ms", elapsed)
+                        # Streams are compared on time to first token
+                        self.router.record(route.model, ttft if ttft is not None else elapsed, outcome == "success")
+            
+            self.breaker.record_success()
+            record_usage(route.model, usage)
+            CHAT_ANSWERS.inc(source="upstream")
+            # Only complete responses are cached
+            content = "".join(chunks)
+            self.response_cache.set(user_message, recent_history, version, content)
+            self.grounding.submit(GroundingJob(user_message, content, version, tuple(recent_history)))
+        except (asyncio.CancelledError, GeneratorExit):
+            self.breaker.release()
+            raise
+        except Exception as e:
+            logger.error("Error streaming from Groq API: %s", e)
+            if not is_transient_error(e):
+                self.breaker.release()
+                raise Exception(f"AI service error: {str(e)}")
+            self.breaker.record_failure()
+            if chunks:
+                raise Exception(f"AI service error: {str(e)}")
+            CHAT_ANSWERS.inc(source="fallback")
+            yield self.build_fallback_response(user_message)
+    
+    async def answer_batch(
+        self,
+        questions: Sequence[str],
+        concurrency: int = CHAT_BATCH_CONCURRENCY
+    ) -> AsyncIterator[BatchAnswer]:
+        """
+        Answer independent first-message questions concurrently
+        
+        Every question goes through get_ai_response against the same cached
+        system prompt, so direct, precomputed and cached answers are reused.
+        At most `concurrency` questions are in flight; answers are yielded in
+        input order as soon as each one and all before it are done. A failing
+        question yields an error entry instead of ending the batch; that
+        includes questions the upstream could not answer, which get no
+        fallback answer since a batch evaluates the model's answers. Closing
+        the iterator cancels the questions still pending.
+        """
+        if not self.configured:
+            raise AIServiceNotConfigured("GROQ_API_KEY environment variable is required")
+        
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def answer(question: str) -> str:
+            if not question:
+                raise ValueError("Message cannot be empty")
+            async with semaphore:
+                return await self.get_ai_response(question, [], fallback=False)
+        
+        tasks = [asyncio.create_task(answer(question)) for question in questions]
+        try:
+            for index, (question, task) in enumerate(zip(questions, tasks)):
+                try:
+                    yield BatchAnswer(index, question, response=await task)
+                except Exception as e:
+                    yield BatchAnswer(index, question, error=str(e) or type(e).__name__)
+        finally:
+            for task in tasks:
+                task.cancel()
     
     def get_suggested_questions(self) -> List[str]:
-        """Return a list of suggested questions visitors can ask"""
-        return [
-            "What projects have you built with React?",
-            "Tell me about your most complex project",
-            "What's your experience with AI and machine learning?",
-            "Can you build scalable web applications?",
-            "What technologies are you most proficient in?",
-            "Tell me about your experience working in teams"
-        ]
+        """Return a list of suggested questions visitors can ask (generated from the portfolio data)"""
+        return list(self.suggested_questions)
+
+    async def precompute_answer(self, question: str) -> str:
+        """
+        Generate a first-message answer for the answer index
+        
+        Unlike get_ai_response there is no cache, coalescing or fallback:
+        errors are raised so a failed question is simply retried later.
+        """
+        messages = self.build_messages(question, [])
+        route = self.route_messages(question, messages)
+        response = await call_with_retries(
+            lambda: self._create_completion(messages, route),
+            attempts=GROQ_RETRY_ATTEMPTS,
+            attempt_timeout=GROQ_ATTEMPT_TIMEOUT,
+            deadline=GROQ_TOTAL_DEADLINE
+        )
+        record_usage(route.model, getattr(response, "usage", None))
+        return response.choices[0].message.content
+
+    async def warm_answer_index(self) -> bool:
+        """
+        Answer every suggested question for the current prompt version
+        
+        Answers another worker already computed for this version are taken
+        from the shared cache instead of calling the upstream again.
+        
+        Returns:
+            True if all questions were answered
+        """
+        version = self.prompt_version
+        questions = list(self.answer_index.questions)
+        semaphore = asyncio.Semaphore(ANSWER_WARM_CONCURRENCY)
+        shared = self.shared_answers
+        
+        async def warm(question: str) -> bool:
+            key = f"answer:{version}:{normalize_message(question)}"
+            async with semaphore:
+                try:
+                    answer = await shared.get(key) if shared is not None else None
+                    if answer is None:
+                        answer = await self.precompute_answer(question)
+                        report = self.grounding.check(answer)
+                        if report is not None and not report.grounded:
+                            # Not retried until the next refresh; visitors get a live answer meanwhile
+                            logger.warning("Not precomputing ungrounded answer for %r: %s", question, report.ungrounded)
+                            return True
+                        if shared is not None:
+                            await shared.set(key, answer, ANSWER_REFRESH_INTERVAL)
+                except Exception as e:
+                    logger.warning("Could not precompute answer for %r: %s", question, e)
+                    return False
+                return self.answer_index.put(question, version, answer)
+        
+        results = await asyncio.gather(*(warm(question) for question in questions))
+        if all(results):
+            self.answer_index.mark_refreshed(version)
+        return all(results)
+
+    def _discard_ungrounded(self, job: GroundingJob, report: GroundingReport) -> None:
+        self.response_cache.discard(job.question, list(job.history), job.version)
+
+    async def check_answers(self) -> None:
+        """Check upstream answers for ungrounded claims until cancelled, evicting them from the cache"""
+        await self.grounding.run(self._discard_ungrounded)
+
+    async def keep_answers_warm(self) -> None:
+        """
+        Keep the answer index populated until cancelled
+        
+        Warms after every prompt version change and every
+        ANSWER_REFRESH_INTERVAL seconds; a partial warm-up is retried after
+        ANSWER_RETRY_INTERVAL. Skipped while the upstream circuit is open.
+        """
+        while True:
+            self._answers_stale.clear()
+            complete = False
+            if self.breaker.state == CircuitBreaker.CLOSED:
+                with Timer() as timer:
+                    complete = await self.warm_answer_index()
+                logger.info(
+                    "Answer index %s in %.0f ms (%d answers)",
+                    "warmed" if complete else "partially warmed", timer.elapsed * 1000, len(self.answer_index)
+                )
+            
+            try:
+                await asyncio.wait_for(
+                    self._answers_stale.wait(),
+                    timeout=ANSWER_REFRESH_INTERVAL if complete else ANSWER_RETRY_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                pass
 
 
-# Create a singleton instance
+# Create a singleton instance (cheap: no SDK import or network client yet)
 ai_service = AIService()
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+Answer Index - Precomputed answers for the suggested questions
+Suggested questions are generated from the portfolio data and answered
+ahead of time, so clicking one is served without an upstream call
+"""
+
+import time
+from collections import Counter
+from itertools import zip_longest
+from typing import Any, Dict, List, Optional
+
+from response_cache import normalize_message
+
+
+SUGGESTED_QUESTION_COUNT = 6
+
+
+def generate_suggested_questions(data: Dict[str, Any], limit: int = SUGGESTED_QUESTION_COUNT) -> List[str]:
+    """
+    Build suggested questions from the portfolio content
+
+    Mixes the most used technologies, the first listed (featured) projects
+    and the most recent role, ending with a general skills question.
+    """
+    # Most used technologies first; the stable sort keeps ties in order of first appearance
+    tech_counts: Counter = Counter()
+    tech_names: Dict[str, str] = {}
+    for proj in data["projects"]:
+        for tech in proj.get("tech", ()):
+            key = tech.lower()
+            tech_names.setdefault(key, tech)
+            tech_counts[key] += 1
+    top_tech = sorted(tech_names, key=lambda key: -tech_counts[key])
+
+    tech_questions = [f"What projects have you built with {tech_names[key]}?" for key in top_tech[:2]]
+    project_questions = [f"Tell me about the {proj['title']} project" for proj in data["projects"][:2]]
+    experience_questions = [
+        f"What did you work on as {exp['role']} at {exp['company']}?" for exp in data["experience"][:1]
+    ]
+
+    questions: List[str] = []
+    for group in zip_longest(tech_questions, project_questions, experience_questions):
+        questions.extend(question for question in group if question)
+    questions = questions[:limit - 1]
+    questions.append("What technologies are you most proficient in?")
+    return questions
+
+
+class AnswerIndex:
+    """
+    Answers to the suggested questions for one content version
+
+    Lookups match the normalized question exactly. Resetting to a new
+    version drops every answer, since they were generated from the old
+    prompt; answers computed for a version that is no longer current are
+    ignored.
+    """
+
+    def __init__(self):
+        self.version: Optional[str] = None
+        self.questions: List[str] = []
+        self._answers: Dict[str, str] = {}
+        self.refreshed_at: Optional[float] = None
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._answers)
+
+    def reset(self, version: str, questions: List[str]) -> None:
+        self.version = version
+        self.questions = list(questions)
+        self._answers = {}
+        self.refreshed_at = None
+
+    def get(self, message: str, version: Optional[str]) -> Optional[str]:
+        if version != self.version:
+            return None
+        answer = self._answers.get(normalize_message(message))
+        if answer is not None:
+            self.hits += 1
+        return answer
+
+    def put(self, question: str, version: str, answer: str) -> bool:
+        """Store an answer; returns False if the version is no longer current"""
+        if version != self.version:
+            return False
+        self._answers[normalize_message(question)] = answer
+        return True
+
+    def mark_refreshed(self, version: str) -> None:
+        if version == self.version:
+            self.refreshed_at = time.time()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "answers": len(self._answers),
+            "questions": len(self.questions),
+            "refreshed_at": self.refreshed_at,
+            "hits": self.hits
+        }
@@ -0,0 +1,68 @@
+"""
+Import-Time Check - Guards the application's cold-start import budget
+Imports `main` in fresh interpreters (without GROQ_API_KEY) and fails when
+the median import time exceeds the budget
+
+Run from backend/:
+    python bench/check_import_time.py --budget-ms 800
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = (
+    "import time, sys, json\n"
+    "started = time.perf_counter()\n"
+    "import main\n"
+    "elapsed = time.perf_counter() - started\n"
+    "print(json.dumps({'import_ms': elapsed * 1000, 'groq_loaded': 'groq' in sys.modules}))\n"
+)
+
+
+def measure_once() -> dict:
+    """Import main in a fresh interpreter and return its timing report"""
+    env = dict(os.environ)
+    env.pop("GROQ_API_KEY", None)
+    env["LOG_LEVEL"] = "WARNING"
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the backend import-time budget")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=800)
+    args = parser.parse_args()
+
+    reports = [measure_once() for _ in range(args.runs)]
+    timings = [report["import_ms"] for report in reports]
+    median = statistics.median(timings)
+
+    print(f"import main: median {median:.0f} ms over {args.runs} runs "
+          f"(min {min(timings):.0f}, max {max(timings):.0f}, budget {args.budget_ms:.0f})")
+
+    failed = False
+    if median > args.budget_ms:
+        print("FAIL: import time exceeds budget")
+        failed = True
+    if any(report["groq_loaded"] for report in reports):
+        print("FAIL: the Groq SDK is imported eagerly")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Fake Groq Server - Local OpenAI-compatible chat completions endpoint
+Lets the backend be benchmarked without network access or API quota
+
+Run:
+    python bench/fake_groq.py --port 8900 --ttft 0.2 --latency 1.0
+and start the backend with GROQ_BASE_URL=http://127.0.0.1:8900
+"""
+
+import json
+import time
+import random
+import asyncio
+import argparse
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+
+class FakeGroqConfig:
+    """Simulated upstream behaviour"""
+
+    def __init__(
+        self,
+        ttft: float = 0.2,
+        latency: float = 1.0,
+        tokens: int = 60,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        jitter: float = 0.1
+    ):
+        self.ttft = ttft
+        self.latency = latency
+        self.tokens = tokens
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.jitter = jitter
+
+    def delay(self, seconds: float) -> float:
+        """Apply +/- jitter (as a fraction) to a delay"""
+        return max(0.0, seconds * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+
+def _usage(messages, completion_tokens: int) -> dict:
+    prompt_chars = sum(len(msg.get("content", "")) for msg in messages)
+    prompt_tokens = prompt_chars // 4 + 1
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def create_app(config: FakeGroqConfig) -> Starlette:
+    requests_served = {"count": 0}
+
+    async def chat_completions(request: Request):
+        body = await request.json()
+        requests_served["count"] += 1
+        model = body.get("model", "fake-model")
+        messages = body.get("messages", [])
+        created = int(time.time())
+        completion_id = f"chatcmpl-fake-{requests_served['count']}"
+
+        if config.error_rate and random.random() < config.error_rate:
+            await asyncio.sleep(config.delay(config.ttft))
+            return JSONResponse(
+                {"error": {"message": "Simulated upstream failure", "type": "server_error"}},
+                status_code=config.error_status
+            )
+
+        words = [f"token{i}" for i in range(config.tokens)]
+
+        if not body.get("stream"):
+            await asyncio.sleep(config.delay(config.latency))
+            return JSONResponse({
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": " ".join(words)},
+                    "finish_reason": "stop",
+                }],
+                "usage": _usage(messages, config.tokens),
+            })
+
+        async def event_stream():
+            await asyncio.sleep(config.delay(config.ttft))
+            per_token = max(0.0, config.latency - config.ttft) / max(1, config.tokens)
+            for index, word in enumerate(words):
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "delta": {"content": word if index == 0 else f" {word}"},
+                        "finish_reason": None,
+                    }],
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+                if per_token:
+                    await asyncio.sleep(per_token)
+            final = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                "x_groq": {"id": completion_id, "usage": _usage(messages, config.tokens)},
+            }
+            yield f"data: {json.dumps(final)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+    async def stats(request: Request):
+        return JSONResponse(requests_served)
+
+    return Starlette(routes=[
+        Route("/openai/v1/chat/completions", chat_completions, methods=["POST"]),
+        Route("/_stats", stats, methods=["GET"]),
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Groq chat completions server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--ttft", type=float, default=0.2, help="Seconds to first token")
+    parser.add_argument("--latency", type=float, default=1.0, help="Seconds to full completion")
+    parser.add_argument("--tokens", type=int, default=60, help="Completion tokens per answer")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--jitter", type=float, default=0.1, help="Relative latency jitter")
+    args = parser.parse_args()
+
+    import uvicorn
+    config = FakeGroqConfig(
+        ttft=args.ttft,
+        latency=args.latency,
+        tokens=args.tokens,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        jitter=args.jitter,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+"""
+Backend Benchmark - Load scenarios against a local app and fake Groq server
+Reports latency percentiles, throughput and memory, and stores/compares
+JSON baselines
+
+Run from the backend directory:
+    python bench/run_bench.py --output bench/baselines/local.json
+    python bench/run_bench.py --compare bench/baselines/local.json
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import socket
+import asyncio
+import argparse
+import platform
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+BENCH_DIR = Path(__file__).resolve().parent
+
+SUGGESTED_QUESTIONS = [
+    "What projects have you built with React?",
+    "Tell me about your most complex project",
+    "What's your experience with AI and machine learning?",
+    "Can you build scalable web applications?",
+    "What technologies are you most proficient in?",
+    "Tell me about your experience working in teams",
+]
+
+# Metrics compared against a baseline; higher_is_better decides the direction
+COMPARED_METRICS = {"p50_ms": False, "p95_ms": False, "p99_ms": False, "rps": True}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_mb(pid: int) -> Optional[float]:
+    """Resident set size of a process in MiB (Linux only)"""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], errors: int, duration: float) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 2) if ordered else 0.0,
+        "rps": round(len(latencies) / duration, 2) if duration else 0.0,
+    }
+
+
+async def run_load(
+    make_request: Callable[[int], Awaitable[httpx.Response]],
+    total: int,
+    concurrency: int
+) -> Dict[str, float]:
+    """Issue `total` requests from `concurrency` workers and summarize latencies"""
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for index in counter:
+            started = time.perf_counter()
+            try:
+                response = await make_request(index)
+                if response.status_code >= 400:
+                    errors += 1
+                    continue
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+class ManagedProcess:
+    """Subprocess started for the benchmark and terminated afterwards"""
+
+    def __init__(self, args: List[str], env: Dict[str, str]):
+        self.process = subprocess.Popen(
+            args,
+            cwd=BACKEND_DIR,
+            env={**os.environ, **env},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def stop(self) -> None:
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+async def wait_ready(url: str, process: ManagedProcess, timeout: float = 30) -> float:
+    """Poll url until it returns 200; returns seconds waited"""
+    started = time.perf_counter()
+    async with httpx.AsyncClient() as client:
+        while time.perf_counter() - started < timeout:
+            if process.process.poll() is not None:
+                stderr = process.process.stderr.read().decode(errors="replace")
+                raise RuntimeError(f"Process exited during startup:\n{stderr}")
+            try:
+                response = await client.get(url, timeout=1)
+                if response.status_code == 200:
+                    return time.perf_counter() - started
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.01)
+    raise RuntimeError(f"Timed out waiting for {url}")
+
+
+def start_fake_groq(port: int, args) -> ManagedProcess:
+    return ManagedProcess([
+        sys.executable, str(BENCH_DIR / "fake_groq.py"),
+        "--port", str(port),
+        "--ttft", str(args.upstream_ttft),
+        "--latency", str(args.upstream_latency),
+        "--error-rate", str(args.upstream_error_rate),
+    ], env={})
+
+
+def start_app(port: int, groq_port: int) -> ManagedProcess:
+    return ManagedProcess([
+        sys.executable, "-m", "uvicorn", "main:app",
+        "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning",
+    ], env={
+        "GROQ_API_KEY": "bench-key",
+        "GROQ_BASE_URL": f"http://127.0.0.1:{groq_port}",
+        "RATE_LIMIT_MAX_REQUESTS": "1000000000",
+        "LOG_LEVEL": "WARNING",
+    })
+
+
+# Scenarios
+
+async def scenario_cold_start(groq_port: int, args) -> Dict[str, float]:
+    """Process spawn to first successful /api/health and /api/portfolio-data"""
+    health_times, data_times = [], []
+    for _ in range(args.cold_start_runs):
+        port = free_port()
+        app = start_app(port, groq_port)
+        try:
+            health_times.append(await wait_ready(f"http://127.0.0.1:{port}/api/health", app))
+            started = time.perf_counter()
+            async with httpx.AsyncClient() as client:
+                response = await client.get(f"http://127.0.0.1:{port}/api/portfolio-data")
+                response.raise_for_status()
+            data_times.append(time.perf_counter() - started)
+        finally:
+            app.stop()
+    return {
+        "runs": args.cold_start_runs,
+        "health_ready_ms": round(statistics.median(health_times) * 1000, 2),
+        "first_portfolio_data_ms": round(statistics.median(data_times) * 1000, 2),
+    }
+
+
+async def scenario_portfolio_burst(client: httpx.AsyncClient, args) -> Dict[str, float]:
+    """Burst of /api/portfolio-data page loads"""
+    return await run_load(
+        lambda _: client.get("/api/portfolio-data", headers={"Accept-Encoding": "gzip"}),
+        total=args.portfolio_requests,
+        concurrency=args.concurrency,
+    )
+
+
+async def scenario_chat_history(client: httpx.AsyncClient, args) -> Dict[str, float]:
+    """
+    Concurrent conversations whose history grows each turn
+
+    /api/health is probed throughout; if chat calls blocked the event loop,
+    health latency would track upstream latency instead of staying flat.
+    """
+    conversations = args.concurrency
+    turns = args.chat_turns
+    done = asyncio.Event()
+    health_latencies: List[float] = []
+
+    async def probe_health():
+        while not done.is_set():
+            started = time.perf_counter()
+            await client.get("/api/health")
+            health_latencies.append(time.perf_counter() - started)
+            await asyncio.sleep(0.05)
+
+    latencies: List[float] = []
+    errors = 0
+
+    async def conversation(conversation_id: int):
+        nonlocal errors
+        session_id = None
+        for turn in range(turns):
+            message = f"Turn {turn} of conversation {conversation_id}: {random.choice(SUGGESTED_QUESTIONS)} ({uuid.uuid4().hex[:6]})"
+            started = time.perf_counter()
+            # History is kept server-side; only the new message is sent
+            response = await client.post("/api/chat", json={
+                "message": message,
+                "session_id": session_id,
+            })
+            if response.status_code != 200:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            session_id = response.json()["session_id"]
+
+    prober = asyncio.create_task(probe_health())
+    started = time.perf_counter()
+    await asyncio.gather(*(conversation(i) for i in range(conversations)))
+    duration = time.perf_counter() - started
+    done.set()
+    await prober
+
+    result = summarize(latencies, errors, duration)
+    health = summarize(health_latencies, 0, duration)
+    result["health_p50_ms"] = health["p50_ms"]
+    result["health_p99_ms"] = health["p99_ms"]
+    return result
+
+
+async def scenario_suggested_mix(client: httpx.AsyncClient, args) -> Dict[str, float]:
+    """First-message traffic: mostly suggested questions, some unique ones"""
+    # The questions are generated from the portfolio data, so ask the app
+    suggested = (await client.get("/api/suggested-questions")).json()["questions"]
+
+    def make_request(index: int):
+        if random.random() < 0.8:
+            message = random.choice(suggested)
+        else:
+            message = f"Do you know {uuid.uuid4().hex[:8]}?"
+        return client.post("/api/chat", json={"message": message})
+
+    return await run_load(make_request, total=args.chat_requests, concurrency=args.concurrency)
+
+
+async def scenario_chat_stream(client: httpx.AsyncClient, args) -> Dict[str, float]:
+    """Time to first token event on /api/chat/stream (unique questions)"""
+    ttfb: List[float] = []
+    errors = 0
+    counter = iter(range(args.stream_requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in counter:
+            started = time.perf_counter()
+            async with client.stream("POST", "/api/chat/stream", json={
+                "message": f"Tell me about project {uuid.uuid4().hex[:8]}"
+            }) as response:
+                if response.status_code != 200:
+                    errors += 1
+                    continue
+                first = None
+                async for line in response.aiter_lines():
+                    if first is None and line.startswith("event: token"):
+                        first = time.perf_counter() - started
+                if first is None:
+                    errors += 1
+                else:
+                    ttfb.append(first)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    result = summarize(ttfb, errors, time.perf_counter() - started)
+    result["metric"] = "time_to_first_token"
+    return result
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Return regressions beyond tolerance (relative) versus a baseline"""
+    regressions = []
+    for scenario, metrics in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(scenario)
+        if not base:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            if metric not in metrics or not base.get(metric):
+                continue
+            change = (metrics[metric] - base[metric]) / base[metric]
+            if (change < -tolerance) if higher_is_better else (change > tolerance):
+                regressions.append(
+                    f"{scenario}.{metric}: {base[metric]} -> {metrics[metric]} ({change:+.0%})"
+                )
+    return regressions
+
+
+def print_report(results: Dict) -> None:
+    print(f"\nBenchmark @ {results['timestamp']} ({results['environment']['python']})")
+    for scenario, metrics in results["scenarios"].items():
+        summary = ", ".join(f"{key}={value}" for key, value in metrics.items())
+        print(f"  {scenario:18} {summary}")
+    print(f"  rss_mb: start={results['rss_mb']['start']} end={results['rss_mb']['end']}")
+
+
+async def run(args) -> Dict:
+    groq_port, app_port = free_port(), free_port()
+    fake_groq = start_fake_groq(groq_port, args)
+    app = None
+    try:
+        await wait_ready(f"http://127.0.0.1:{groq_port}/_stats", fake_groq)
+        scenarios = {}
+
+        if "cold_start" in args.scenarios:
+            scenarios["cold_start"] = await scenario_cold_start(groq_port, args)
+
+        app = start_app(app_port, groq_port)
+        await wait_ready(f"http://127.0.0.1:{app_port}/api/health", app)
+        rss_start = rss_mb(app.pid)
+
+        limits = httpx.Limits(max_connections=args.concurrency + 4)
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{app_port}", limits=limits, timeout=60
+        ) as client:
+            runners = {
+                "portfolio_burst": scenario_portfolio_burst,
+                "chat_history": scenario_chat_history,
+                "suggested_mix": scenario_suggested_mix,
+                "chat_stream": scenario_chat_stream,
+            }
+            for name, runner in runners.items():
+                if name in args.scenarios:
+                    scenarios[name] = await runner(client, args)
+
+        return {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+                "upstream_ttft_s": args.upstream_ttft,
+                "upstream_latency_s": args.upstream_latency,
+                "concurrency": args.concurrency,
+            },
+            "rss_mb": {"start": rss_start, "end": rss_mb(app.pid)},
+            "scenarios": scenarios,
+        }
+    finally:
+        if app is not None:
+            app.stop()
+        fake_groq.stop()
+
+
+def main():
+    all_scenarios = ["cold_start", "portfolio_burst", "chat_history", "suggested_mix", "chat_stream"]
+    parser = argparse.ArgumentParser(description="Benchmark the portfolio backend")
+    parser.add_argument("--scenarios", nargs="+", default=all_scenarios, choices=all_scenarios)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--portfolio-requests", type=int, default=2000)
+    parser.add_argument("--chat-requests", type=int, default=300)
+    parser.add_argument("--chat-turns", type=int, default=6)
+    parser.add_argument("--stream-requests", type=int, default=100)
+    parser.add_argument("--cold-start-runs", type=int, default=3)
+    parser.add_argument("--upstream-ttft", type=float, default=0.2)
+    parser.add_argument("--upstream-latency", type=float, default=1.0)
+    parser.add_argument("--upstream-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    results = asyncio.run(run(args))
+    print_report(results)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions versus baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions versus baseline")
+
+
+if __name__ == "__main__":
+    main()
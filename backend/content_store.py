@@ -0,0 +1,182 @@
+"""
+Content Store - Hot-reloadable portfolio content
+Holds an immutable snapshot of the portfolio data and its indexes, watches
+the content file and atomically swaps in a new snapshot when it changes
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from portfolio_data import PORTFOLIO_DATA_FILE, InvalidPortfolioData, load_portfolio_data
+from portfolio_index import PortfolioIndex
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds between modification-time checks when watchfiles is unavailable
+CONTENT_POLL_INTERVAL = float(os.environ.get("CONTENT_POLL_INTERVAL", "2"))
+
+
+def portfolio_fingerprint(data: Dict) -> str:
+    """Return a short, stable content hash of the portfolio data"""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def freeze(value: Any) -> Any:
+    """Convert lists to tuples (recursively) so a snapshot's records can't be appended to"""
+    if isinstance(value, dict):
+        return {key: freeze(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class PortfolioContent:
+    """One loaded version of the portfolio content and its precomputed indexes"""
+    data: Dict[str, Any]
+    version: str
+    index: PortfolioIndex
+    loaded_at: float
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "PortfolioContent":
+        data = freeze(data)
+        return cls(
+            data=data,
+            version=portfolio_fingerprint(data),
+            index=PortfolioIndex(data),
+            loaded_at=time.time()
+        )
+
+
+class ContentStore:
+    """
+    Current portfolio content, reloaded when the content file changes
+
+    Readers take `store.current` once per request and use that snapshot
+    throughout, so a reload never exposes a half-updated view. Subscribers
+    are called on the event loop after each swap to rebuild whatever they
+    derived from the previous snapshot (prompt, caches, payloads).
+    """
+
+    def __init__(self, path: str = PORTFOLIO_DATA_FILE, poll_interval: float = CONTENT_POLL_INTERVAL):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.reloads = 0
+        self.reload_errors = 0
+        self._subscribers: List[Callable[[PortfolioContent], None]] = []
+        self._stopping: Optional[asyncio.Event] = None
+        self._content = self._load()
+
+    @property
+    def current(self) -> PortfolioContent:
+        return self._content
+
+    def subscribe(self, callback: Callable[[PortfolioContent], None]) -> None:
+        """Call callback(content) after every swap to a new version"""
+        self._subscribers.append(callback)
+
+    def _load(self) -> PortfolioContent:
+        return PortfolioContent.from_data(load_portfolio_data(self.path))
+
+    def _mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+    def swap(self, content: PortfolioContent) -> bool:
+        """
+        Make content current and notify subscribers
+
+        Returns:
+            True if the version changed, False if it was identical
+        """
+        if content.version == self._content.version:
+            return False
+
+        self._content = content
+        self.reloads += 1
+        logger.info("Portfolio content reloaded (version %s)", content.version)
+        for callback in self._subscribers:
+            try:
+                callback(content)
+            except Exception:
+                logger.exception("Content subscriber %r failed", callback)
+        return True
+
+    async def reload(self) -> bool:
+        """
+        Re-read the content file and swap it in if it changed
+
+        Parsing and indexing run off the event loop. An invalid file is
+        logged and ignored; the previous snapshot stays current.
+        """
+        try:
+            content = await asyncio.to_thread(self._load)
+        except (OSError, InvalidPortfolioData) as e:
+            self.reload_errors += 1
+            logger.error("Keeping previous portfolio content: %s", e)
+            return False
+        return self.swap(content)
+
+    async def watch(self) -> None:
+        """Reload on file changes until stop() is called (watchfiles, or mtime polling)"""
+        self._stopping = asyncio.Event()
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            await self._poll(self._stopping)
+            return
+
+        # Watch the directory so editors that save via rename are still seen
+        path = os.path.abspath(self.path)
+        async for _ in awatch(
+            os.path.dirname(path),
+            watch_filter=lambda change, changed: os.path.abspath(changed) == path,
+            recursive=False,
+            stop_event=self._stopping
+        ):
+            await self.reload()
+
+    def stop(self) -> None:
+        """
+        Ask a running watch() to return
+
+        Preferred over cancelling the task: the watchfiles watcher runs in a
+        worker thread that must exit before the interpreter shuts down.
+        """
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def _poll(self, stopping: asyncio.Event) -> None:
+        last_mtime = self._mtime()
+        while not stopping.is_set():
+            try:
+                await asyncio.wait_for(stopping.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            mtime = self._mtime()
+            if mtime is not None and mtime != last_mtime:
+                last_mtime = mtime
+                await self.reload()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self._content.version,
+            "loaded_at": self._content.loaded_at,
+            "reloads": self.reloads,
+            "reload_errors": self.reload_errors
+        }
+
+
+# Create singleton instance
+content_store = ContentStore()
@@ -0,0 +1,266 @@
+"""
+Grounding - Post-response fact checks against the portfolio data
+Extracts the technologies, years, companies and project titles an answer
+mentions and checks each against lookup tables built once per content
+version; answers are checked by a background worker, off the request path
+"""
+
+import os
+import re
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+
+from metrics import GROUNDING_CHECKS, GROUNDING_DURATION, GROUNDING_UNGROUNDED
+
+logger = logging.getLogger(__name__)
+
+
+GROUNDING_QUEUE_SIZE = int(os.environ.get("GROUNDING_QUEUE_SIZE", "256"))
+# Longest phrase (in words) matched exactly; longer mentions are checked window by window
+MAX_PHRASE_WORDS = 4
+
+TECH = "technology"
+YEAR = "year"
+COMPANY = "company"
+PROJECT = "project"
+
+# Technologies a model might claim. Matches that never appear in the
+# portfolio are ungrounded; words that are also common English ("express",
+# "spark", "go") are left out or listed only in unambiguous forms.
+KNOWN_TECHNOLOGIES = (
+    "aws", "amazon web services", "azure", "gcp", "google cloud", "docker", "kubernetes",
+    "terraform", "ansible", "jenkins", "github actions", "gitlab", "heroku", "netlify",
+    "django", "flask", "express.js", "node.js", "nodejs", "next.js", "vue", "vue.js", "angular",
+    "svelte", "typescript", "javascript", "java", "kotlin", "scala", "golang", "c++", "c#", "php",
+    "laravel", "ruby", "ruby on rails", "rust",
+    "pytorch", "keras", "xgboost", "lightgbm", "hugging face", "langchain", "llamaindex",
+    "openai", "gpt-4", "bert", "opencv", "nltk", "spacy",
+    "pyspark", "apache spark", "hadoop", "kafka", "airflow", "dbt", "snowflake", "databricks",
+    "bigquery", "redshift", "mongodb", "mysql", "redis", "cassandra", "elasticsearch", "dynamodb",
+    "firebase", "supabase", "graphql", "postgresql", "sqlite",
+    "tableau", "looker", "power bi", "matplotlib", "seaborn", "plotly", "numpy", "pandas", "scipy",
+    "streamlit", "tensorflow", "scikit-learn", "fastapi", "react", "react.js", "tailwind css",
+    "bootstrap", "recharts", "selenium", "figma", "jira", "sas", "spss", "stata", "matlab",
+    "excel", "vba", "power query", "power automate", "sharepoint", "salesforce",
+)
+
+# Word tokens; keeps names like node.js, scikit-learn, c++ and c# whole
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#-]*(?:\.[a-z0-9+#]+)*")
+_YEAR = re.compile(r"\b(?:19|20)\d{2}\b")
+# A dot continues a word only when more of it follows ("Node.js"), so a run
+# stops at the end of a sentence instead of joining the next one's first word
+_CAPITALIZED_WORD = r"[A-Z](?:[\w+#-]|\.(?=[\w+#]))*"
+_CAPITALIZED_RUN = _CAPITALIZED_WORD + r"(?:\s+(?:&\s+)?" + _CAPITALIZED_WORD + ")*"
+# "at Acme Corp" - the organization someone worked at
+_AT_ORGANIZATION = re.compile(r"\bat\s+(" + _CAPITALIZED_RUN + ")")
+# "the Stock Price Predictor project"
+_NAMED_PROJECT = re.compile(r"(" + _CAPITALIZED_RUN + r")\s+(?:project|app|application|system)\b")
+# Capitalized words that start a phrase without being part of a name
+_LEADING_WORDS = {"the", "a", "an", "this", "that", "his", "her", "their", "my", "our", "your"}
+
+
+def words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def _strings(value: Any) -> Iterator[str]:
+    """Every string in a nested structure of dicts, lists and tuples"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _strings(item)
+
+
+class PhraseTrie:
+    """Word-level trie for longest-match phrase extraction in one pass over a text"""
+
+    _END = ""
+
+    def __init__(self, phrases=()):
+        self._root: Dict[str, Any] = {}
+        for phrase in phrases:
+            self.add(phrase)
+
+    def add(self, phrase: str) -> None:
+        node = self._root
+        for word in words(phrase):
+            node = node.setdefault(word, {})
+        node[self._END] = True
+
+    def find(self, tokens: List[str]) -> List[Tuple[str, ...]]:
+        """Return the longest phrase starting at each position, skipping over matches"""
+        found = []
+        i = 0
+        while i < len(tokens):
+            node, end = self._root, None
+            for j in range(i, len(tokens)):
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                if self._END in node:
+                    end = j + 1
+            if end is None:
+                i += 1
+            else:
+                found.append(tuple(tokens[i:end]))
+                i = end
+        return found
+
+
+@dataclass(frozen=True)
+class GroundingReport:
+    """Entities found in one answer and those the portfolio does not support"""
+    entities: int
+    ungrounded: Tuple[Tuple[str, str], ...]  # (kind, phrase)
+
+    @property
+    def grounded(self) -> bool:
+        return not self.ungrounded
+
+
+class GroundingIndex:
+    """
+    Lookup tables for one version of the portfolio data
+
+    Every 1..MAX_PHRASE_WORDS word sequence of the portfolio text goes in a
+    set, so checking a mention is a few set lookups however large the
+    content is. Technology mentions are found with a trie over the known
+    technologies plus the portfolio's own.
+    """
+
+    def __init__(self, data: Dict[str, Any], version: Optional[str] = None):
+        self.version = version
+        phrases: Set[Tuple[str, ...]] = set()
+        years: Set[str] = {str(date.today().year)}
+        for text in _strings(data):
+            tokens = words(text)
+            for n in range(1, MAX_PHRASE_WORDS + 1):
+                phrases.update(tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+            # Parts of dotted and hyphenated tokens ("react" of react.js, "linkedin" of a URL)
+            phrases.update((part,) for token in tokens for part in re.split(r"[.-]", token) if part)
+            years.update(_YEAR.findall(text))
+        self.phrases: FrozenSet[Tuple[str, ...]] = frozenset(phrases)
+        self.years: FrozenSet[str] = frozenset(years)
+
+        portfolio_tech = [
+            tech
+            for section in ("projects", "experience")
+            for record in data.get(section, ())
+            for tech in record.get("tech", ()) or record.get("technologies", ())
+        ]
+        portfolio_tech += [skill for skills in data.get("skills", {}).values() for skill in skills]
+        self.technologies = PhraseTrie(KNOWN_TECHNOLOGIES + tuple(portfolio_tech))
+
+    def supports(self, phrase: Tuple[str, ...]) -> bool:
+        """True if the words appear in this order somewhere in the portfolio"""
+        if len(phrase) <= MAX_PHRASE_WORDS:
+            return phrase in self.phrases
+        return all(
+            phrase[i:i + MAX_PHRASE_WORDS] in self.phrases
+            for i in range(len(phrase) - MAX_PHRASE_WORDS + 1)
+        )
+
+    def _names(self, pattern: re.Pattern, text: str, min_words: int) -> Iterator[Tuple[str, ...]]:
+        for match in pattern.finditer(text):
+            name = words(match.group(1))
+            while name and name[0] in _LEADING_WORDS:
+                name = name[1:]
+            if len(name) >= min_words:
+                yield tuple(name)
+
+    def check(self, answer: str) -> GroundingReport:
+        mentions: List[Tuple[str, Tuple[str, ...]]] = []
+        mentions.extend((TECH, phrase) for phrase in self.technologies.find(words(answer)))
+        mentions.extend((COMPANY, name) for name in self._names(_AT_ORGANIZATION, answer, 1))
+        mentions.extend((PROJECT, name) for name in self._names(_NAMED_PROJECT, answer, 2))
+
+        ungrounded = []
+        seen = set()
+        for kind, phrase in mentions:
+            if (kind, phrase) not in seen and not self.supports(phrase):
+                ungrounded.append((kind, " ".join(phrase)))
+            seen.add((kind, phrase))
+        years = set(_YEAR.findall(answer))
+        ungrounded.extend((YEAR, year) for year in sorted(years - self.years))
+        return GroundingReport(len(seen) + len(years), tuple(ungrounded))
+
+
+@dataclass(frozen=True)
+class GroundingJob:
+    """An answer waiting to be checked, with what is needed to act on the result"""
+    question: str
+    answer: str
+    version: str
+    history: Tuple[Dict[str, str], ...] = ()
+
+
+class GroundingChecker:
+    """
+    Background worker checking answers against the current GroundingIndex
+
+    submit() never blocks: when the queue is full the answer goes unchecked
+    and is counted as dropped. Reports with ungrounded entities are passed
+    to the on_ungrounded callback (e.g. to evict the answer from a cache).
+    """
+
+    def __init__(self, max_queue: int = GROUNDING_QUEUE_SIZE):
+        self.index: Optional[GroundingIndex] = None
+        self._queue: "asyncio.Queue[GroundingJob]" = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def rebuild(self, data: Dict[str, Any], version: str) -> None:
+        self.index = GroundingIndex(data, version)
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    def check(self, answer: str) -> Optional[GroundingReport]:
+        """Check an answer now and record the result; None before the index is built"""
+        index = self.index
+        if index is None:
+            return None
+        started = time.perf_counter()
+        report = index.check(answer)
+        GROUNDING_DURATION.observe(time.perf_counter() - started)
+        GROUNDING_CHECKS.inc(result="grounded" if report.grounded else "ungrounded")
+        for kind, _ in report.ungrounded:
+            GROUNDING_UNGROUNDED.inc(kind=kind)
+        return report
+
+    def submit(self, job: GroundingJob) -> bool:
+        try:
+            self._queue.put_nowait(job)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            GROUNDING_CHECKS.inc(result="dropped")
+            return False
+
+    async def run(self, on_ungrounded: Callable[[GroundingJob, GroundingReport], None]) -> None:
+        """Check queued answers until cancelled"""
+        while True:
+            job = await self._queue.get()
+            try:
+                index = self.index
+                if index is None or index.version != job.version:
+                    # The answer's prompt version is gone, and so are its cache entries
+                    continue
+                report = self.check(job.answer)
+                if report is not None and not report.grounded:
+                    logger.warning(
+                        "Ungrounded answer to %r: %s",
+                        job.question[:80], ", ".join(f"{kind} {phrase!r}" for kind, phrase in report.ungrounded)
+                    )
+                    on_ungrounded(job, report)
+            except Exception:
+                logger.exception("Grounding check failed")
+            finally:
+                self._queue.task_done()
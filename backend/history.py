@@ -0,0 +1,85 @@
+"""
+Conversation History - Token-budgeted compaction
+Keeps the history sent upstream within a fixed token budget however long the
+conversation gets
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+from retrieval import estimate_tokens
+
+
+# Smallest slice of a partially fitting message worth keeping
+MIN_TRUNCATED_TOKENS = 48
+
+
+def role_content(msg: Any) -> Tuple[str, str]:
+    """Read role/content from a dict or a pydantic Message without copying"""
+    if isinstance(msg, dict):
+        return msg["role"], msg["content"]
+    return msg.role, msg.content
+
+
+def summarize_turns(dropped: Sequence[Any], max_chars: int) -> str:
+    """Summarize dropped turns as the list of questions the visitor asked"""
+    questions = []
+    for msg in dropped:
+        role, content = role_content(msg)
+        if role == "user":
+            questions.append(" ".join(content.split())[:120])
+    summary = "Earlier in this conversation the visitor asked: " + "; ".join(questions)
+    if len(summary) > max_chars:
+        summary = summary[:max_chars - 3].rstrip() + "..."
+    return summary
+
+
+def compact_history(
+    conversation_history: Sequence[Any],
+    token_budget: int,
+    summary_chars: int = 400
+) -> List[Dict[str, str]]:
+    """
+    Select the most recent history that fits in the token budget
+
+    Args:
+        conversation_history: Messages (dicts, Message models or session
+            Turns), oldest first
+        token_budget: Maximum estimated tokens for the returned history
+        summary_chars: Maximum length of the summary of dropped turns
+
+    Returns:
+        Messages in upstream dict format, oldest first. Older turns that do
+        not fit are truncated or replaced by a short summary message.
+    """
+    kept: List[Dict[str, str]] = []
+    remaining = token_budget
+    cutoff = 0
+
+    # Walk newest to oldest until the budget runs out
+    for index in range(len(conversation_history) - 1, -1, -1):
+        msg = conversation_history[index]
+        role, content = role_content(msg)
+        # Stored session turns carry a precomputed estimate
+        tokens = getattr(msg, "tokens", None) or estimate_tokens(content)
+        if tokens <= remaining:
+            kept.append({"role": role, "content": content})
+            remaining -= tokens
+            continue
+
+        if remaining >= MIN_TRUNCATED_TOKENS:
+            # Keep the start of the message, where the question usually is;
+            # sized so estimate_tokens of the result is exactly `remaining`
+            kept.append({"role": role, "content": content[:remaining * 4 - 4] + "..."})
+            remaining = 0
+            cutoff = index
+        else:
+            cutoff = index + 1
+        break
+
+    kept.reverse()
+
+    if cutoff > 0:
+        summary = summarize_turns(conversation_history[:cutoff], summary_chars)
+        kept.insert(0, {"role": "system", "content": summary})
+
+    return kept
@@ -0,0 +1,169 @@
+"""
+HTTP Caching - Pre-serialized, pre-compressed response bodies
+Serves static payloads from memory with ETag revalidation, and compresses
+dynamic responses on the fly
+"""
+
+import gzip
+import json
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Brotli is optional; gzip is always available
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bodies smaller than this are sent uncompressed; the framing overhead
+# outweighs the savings
+COMPRESS_MIN_BYTES = 1024
+
+AVAILABLE_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# Negotiated bodies differ by encoding, and CORS headers by requesting origin
+VARY = "Accept-Encoding, Origin"
+
+
+def etag_matches(if_none_match: Optional[str], etags) -> bool:
+    """Check an If-None-Match header against a set of current ETags"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in etags:
+            return True
+    return False
+
+
+def preferred_encoding(accept_encoding: Optional[str], available) -> Optional[str]:
+    """Pick the best content-coding the client accepts (br > gzip), or None for identity"""
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+    for coding in ("br", "gzip"):
+        if coding in available and accepted.get(coding, accepted.get("*", 0)) > 0:
+            return coding
+    return None
+
+
+class CachedPayload:
+    """
+    A response body serialized and compressed once, served many times
+
+    Each encoding gets its own strong ETag (derived from the uncompressed
+    content hash), and a request whose If-None-Match carries any of them is
+    answered with 304 Not Modified.
+    """
+
+    def __init__(
+        self,
+        body: bytes,
+        media_type: str = "application/json",
+        cache_control: str = "public, max-age=300",
+        compress_min_bytes: int = 0,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        self.media_type = media_type
+        self.cache_control = cache_control
+        # Extra headers of the response the body came from, replayed on every hit
+        self.headers = dict(headers or {})
+        self.version = hashlib.sha256(body).hexdigest()[:32]
+
+        # Compressed once at the highest levels since the result is reused
+        self.bodies: Dict[Optional[str], bytes] = {None: body}
+        if len(body) >= compress_min_bytes:
+            self.bodies["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+            if brotli is not None:
+                self.bodies["br"] = brotli.compress(body, quality=11)
+
+        self.etags: Dict[Optional[str], str] = {
+            coding: f'"{self.version}-{coding}"' if coding else f'"{self.version}"'
+            for coding in self.bodies
+        }
+        self._etag_values = frozenset(self.etags.values())
+
+    @classmethod
+    def from_json(cls, data: Any, **kwargs) -> "CachedPayload":
+        """Serialize data to compact JSON once"""
+        body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return cls(body, **kwargs)
+
+    def response(self, request: Request) -> Response:
+        """Build the response for a request, negotiating encoding and revalidation"""
+        coding = preferred_encoding(request.headers.get("accept-encoding"), self.bodies)
+        headers = {
+            **self.headers,
+            "ETag": self.etags[coding],
+            "Cache-Control": self.cache_control,
+            "Vary": VARY,
+        }
+
+        if etag_matches(request.headers.get("if-none-match"), self._etag_values):
+            return Response(status_code=304, headers=headers)
+
+        if coding:
+            headers["Content-Encoding"] = coding
+        return Response(content=self.bodies[coding], media_type=self.media_type, headers=headers)
+
+
+def compress_body(body: bytes, coding: str) -> bytes:
+    """Compress a one-off response body at a fast level"""
+    if coding == "br":
+        return brotli.compress(body, quality=4)
+    return gzip.compress(body, compresslevel=6)
+
+
+class PayloadMemo:
+    """
+    LRU of CachedPayloads for deterministic GET responses
+
+    Each entry can carry the matched route, so requests served from the memo
+    (which skip routing) are still attributed to it.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[CachedPayload, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Tuple[CachedPayload, Any]]:
+        """Return (payload, route) for a key, or None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Hashable, payload: CachedPayload, route: Any = None) -> None:
+        self._entries[key] = (payload, route)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
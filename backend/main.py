@@ -3,62 +3,246 @@ FastAPI Backend for Portfolio Website
 Main application with API routes
 """
 
-from fastapi import FastAPI, HTTPException
+import time
+_IMPORT_STARTED = time.perf_counter()
+
+import asyncio
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Dict, Literal, Optional
 from datetime import datetime
-from collections import defaultdict
-import time
+from contextlib import asynccontextmanager
+import os
+import json
+import secrets
+import logging
+from dataclasses import asdict
+
+from ai_service import AIServiceNotConfigured, ai_service
+from content_store import PortfolioContent, content_store
+from sessions import Session, create_session_store
+from shared_state import SharedCache, open_shared_state
+from admission import AdmissionController, AdmissionMiddleware
+from rate_limit import InMemoryRateLimiter, SQLiteRateLimiter, client_ip, retry_after_header
+from http_cache import (
+    AVAILABLE_ENCODINGS, COMPRESS_MIN_BYTES, VARY, CachedPayload, PayloadMemo, compress_body, preferred_encoding
+)
+from portfolio_index import (
+    LIST_SECTIONS, SECTIONS, InvalidQuery, parse_fields, project_fields
+)
+from metrics import (
+    HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT, REGISTRY, REQUEST_VALIDATION_DURATION,
+    CallbackMetric, Timer, log_request, record_timing, request_timings
+)
+
+
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(name)s %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# Time spent importing the application (framework, services and data)
+IMPORT_MS = round((time.perf_counter() - _IMPORT_STARTED) * 1000, 1)
 
-from ai_service import ai_service
-from portfolio_data import PORTFOLIO_DATA
+async def warm_up_ai_service():
+    """
+    Build the upstream client in the background while traffic is already served,
+    then keep the suggested-question answers precomputed
+    """
+    if not ai_service.configured:
+        logger.warning("GROQ_API_KEY is not set - chat is disabled, static routes still served")
+        return
+    try:
+        with Timer() as timer:
+            await ai_service.warm_up()
+        logger.info("AI service ready in %.0f ms", timer.elapsed * 1000)
+    except Exception:
+        logger.exception("AI service warm-up failed; it will be retried on first chat")
+        return
+    await ai_service.keep_answers_warm()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan
+    
+    Startup does not wait for the AI client: it is warmed up in a background
+    task so the first bytes of static routes are served immediately. The
+    portfolio content file is watched for hot reloads (CONTENT_WATCH=0 disables),
+    and upstream answers are checked for grounding by a background task.
+    
+    Runs once per worker process, so each worker owns its pooled upstream
+    client and database connections. Uvicorn only runs shutdown once open
+    requests, streaming chats included, have finished or its graceful
+    shutdown timeout (serve.py) has passed, so closing them here cuts off
+    no answer that could still complete.
+    """
+    logger.info("Application imported in %.0f ms (pid %d)", IMPORT_MS, os.getpid())
+    warm_up = asyncio.create_task(warm_up_ai_service())
+    grounding = asyncio.create_task(ai_service.check_answers())
+    watcher = asyncio.create_task(content_store.watch()) if CONTENT_WATCH else None
+    yield
+    warm_up.cancel()
+    grounding.cancel()
+    if watcher is not None:
+        content_store.stop()
+        try:
+            await asyncio.wait_for(watcher, timeout=2)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+    await ai_service.close()
+    session_store.close()
+    if shared_db is not None:
+        shared_db.close()
 
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Portfolio API",
     description="Backend API for AI-powered portfolio website",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# CORS Configuration - Update with your frontend domain
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",  # Local development
-        "http://localhost:5173",  # Vite default port
-        "https://your-portfolio-domain.vercel.app",  # Update with your Vercel domain
-        "*"  # Remove in production, add specific domains
-    ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+# Rate limiting - token bucket per client IP on the chat routes
+RATE_LIMIT_MAX_REQUESTS = int(os.environ.get("RATE_LIMIT_MAX_REQUESTS", "20"))
+RATE_LIMIT_WINDOW = float(os.environ.get("RATE_LIMIT_WINDOW", "60"))  # seconds
+# Number of reverse proxies in front of the app. X-Forwarded-For is ignored
+# unless set, since clients can send any value; the Render deploy sets it to 1
+TRUSTED_PROXY_HOPS = int(os.environ.get("TRUSTED_PROXY_HOPS", "0"))
+RATE_LIMITED_PREFIXES = ("/api/chat",)
+
+# With several workers (SHARED_STATE_PATH set), rate limits, sessions and
+# precomputed answers live in a SQLite file every worker reads and writes
+shared_db = open_shared_state()
+
+if shared_db is not None:
+    rate_limiter = SQLiteRateLimiter(shared_db, RATE_LIMIT_MAX_REQUESTS, RATE_LIMIT_WINDOW)
+    ai_service.shared_answers = SharedCache(shared_db)
+else:
+    rate_limiter = InMemoryRateLimiter(RATE_LIMIT_MAX_REQUESTS, RATE_LIMIT_WINDOW)
+
+# Chat payload limits - oversized history is rejected before it is processed
+MAX_HISTORY_MESSAGES = 50
+MAX_HISTORY_MESSAGE_CHARS = 4000
+MAX_HISTORY_TOTAL_CHARS = 40000
+MAX_CHAT_BODY_BYTES = 256 * 1024
+
+# Batch chat for answer evaluation runs; disabled unless a token is set
+CHAT_BATCH_TOKEN = os.environ.get("CHAT_BATCH_TOKEN", "")
+CHAT_BATCH_MAX_QUESTIONS = int(os.environ.get("CHAT_BATCH_MAX_QUESTIONS", "200"))
+
+# Streamed responses that must not be buffered by the caching middleware
+STREAMING_MEDIA_TYPES = ("text/event-stream", "application/x-ndjson")
+
+
+# Portfolio data is serialized and compressed once per content version and
+# served from memory; the content store rebuilds it when the file changes
+PORTFOLIO_CACHE_MAX_AGE = int(os.environ.get("PORTFOLIO_CACHE_MAX_AGE", "300"))
+CONTENT_WATCH = os.environ.get("CONTENT_WATCH", "1") == "1"
+
+
+def build_portfolio_payload(content: PortfolioContent) -> CachedPayload:
+    data = content.data
+    return CachedPayload.from_json(
+        {
+            "bio": data["bio"],
+            "experience": data["experience"],
+            "projects": data["projects"],
+            "skills": data["skills"],
+            "testimonials": data["testimonials"]
+        },
+        cache_control=f"public, max-age={PORTFOLIO_CACHE_MAX_AGE}"
+    )
+
+
+portfolio_payload = build_portfolio_payload(content_store.current)
+
+# Cache-Control by path prefix, first match wins. GET responses under a
+# "public" policy depend only on the URL and the content version, so their
+# bodies are memoized (compressed once) and served with ETags and 304s.
+SUGGESTED_QUESTIONS_MAX_AGE = int(os.environ.get("SUGGESTED_QUESTIONS_MAX_AGE", "300"))
+CACHE_POLICIES = (
+    ("/api/portfolio-data", f"public, max-age={PORTFOLIO_CACHE_MAX_AGE}"),
+    ("/api/projects", f"public, max-age={PORTFOLIO_CACHE_MAX_AGE}"),
+    ("/api/experience", f"public, max-age={PORTFOLIO_CACHE_MAX_AGE}"),
+    ("/api/suggested-questions", f"public, max-age={SUGGESTED_QUESTIONS_MAX_AGE}"),
+    ("/api/", "no-store"),
+    ("/metrics", "no-store"),
 )
+response_memo = PayloadMemo(max_entries=256)
+# Routes serving their own pre-built payload with an ETag; the memo would
+# never store them, so they skip the lookup too
+SELF_CACHED_PATHS = frozenset({"/api/portfolio-data"})
+
+
+def cache_policy(path: str) -> Optional[str]:
+    """Cache-Control value for a request path, if a policy covers it"""
+    for prefix, cache_control in CACHE_POLICIES:
+        if path.startswith(prefix):
+            return cache_control
+    return None
+
+
+def apply_content(content: PortfolioContent) -> None:
+    """Rebuild everything derived from the previous content version"""
+    global portfolio_payload
+    portfolio_payload = build_portfolio_payload(content)
+    response_memo.clear()
+    # Also clears cached chat answers generated from the old prompt
+    ai_service.refresh_system_prompt(content.data)
 
 
-# Rate limiting storage (in-memory, use Redis in production)
-rate_limit_storage = defaultdict(list)
-RATE_LIMIT_MAX_REQUESTS = 20
-RATE_LIMIT_WINDOW = 60  # seconds
+content_store.subscribe(apply_content)
+
+# Server-side conversation history, so clients only send the new message
+session_store = create_session_store(shared_db)
 
 
 # Request/Response Models
 class Message(BaseModel):
-    role: str = Field(..., description="Role: 'user' or 'assistant'")
-    content: str = Field(..., description="Message content")
+    role: Literal["user", "assistant"] = Field(..., description="Role: 'user' or 'assistant'")
+    content: str = Field(..., max_length=MAX_HISTORY_MESSAGE_CHARS, description="Message content")
 
 
 class ChatRequest(BaseModel):
     message: str = Field(..., min_length=1, max_length=1000, description="User's message")
-    conversation_history: List[Message] = Field(default=[], description="Previous conversation")
+    session_id: Optional[str] = Field(None, max_length=64, description="Session id from a previous response")
+    conversation_history: List[Message] = Field(
+        default=[],
+        max_length=MAX_HISTORY_MESSAGES,
+        description="Previous conversation (only for clients without a session_id)"
+    )
+
+    @field_validator("conversation_history")
+    @classmethod
+    def check_history_size(cls, history: List[Message]) -> List[Message]:
+        total_chars = sum(len(msg.content) for msg in history)
+        if total_chars > MAX_HISTORY_TOTAL_CHARS:
+            raise ValueError(
+                f"conversation_history exceeds {MAX_HISTORY_TOTAL_CHARS} characters"
+            )
+        return history
 
 
 class ChatResponse(BaseModel):
     response: str = Field(..., description="AI assistant's response")
     timestamp: str = Field(..., description="ISO format timestamp")
     suggested_questions: Optional[List[str]] = Field(None, description="Suggested follow-up questions")
+    session_id: Optional[str] = Field(None, description="Session id to send with the next message")
+
+
+class ChatBatchRequest(BaseModel):
+    questions: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=CHAT_BATCH_MAX_QUESTIONS,
+        description="Independent first-message questions, answered without history"
+    )
 
 
 class PortfolioResponse(BaseModel):
@@ -69,27 +253,91 @@ class PortfolioResponse(BaseModel):
     testimonials: List[Dict]
 
 
+# Metrics read from service state at scrape time
+REGISTRY.register(CallbackMetric(
+    "chat_response_cache_lookups_total", "Response cache lookups by result", "counter",
+    lambda: {
+        ("hit",): ai_service.response_cache.hits,
+        ("similar_hit",): ai_service.response_cache.similar_hits,
+        ("miss",): ai_service.response_cache.misses,
+    },
+    labelnames=("result",)
+))
+REGISTRY.register(CallbackMetric(
+    "chat_response_cache_bytes", "Approximate bytes held by the response cache", "gauge",
+    lambda: ai_service.response_cache.stats()["bytes"]
+))
+REGISTRY.register(CallbackMetric(
+    "chat_coalesced_requests_total", "Chat requests that joined an identical in-flight call", "counter",
+    lambda: ai_service.inflight.coalesced
+))
+REGISTRY.register(CallbackMetric(
+    "groq_circuit_open", "1 if the upstream circuit breaker is rejecting calls", "gauge",
+    lambda: 0 if ai_service.breaker.state == "closed" else 1
+))
+REGISTRY.register(CallbackMetric(
+    "groq_model_latency_ewma_seconds", "Smoothed upstream latency per model, as seen by the router", "gauge",
+    lambda: {
+        (model,): stats.latency
+        for model, stats in ai_service.router.stats.items()
+        if stats.latency is not None
+    },
+    labelnames=("model",)
+))
+REGISTRY.register(CallbackMetric(
+    "groq_model_error_rate", "Recent upstream error rate per model, as seen by the router", "gauge",
+    lambda: {(model,): stats.error_rate for model, stats in ai_service.router.stats.items()},
+    labelnames=("model",)
+))
+REGISTRY.register(CallbackMetric(
+    "chat_precomputed_answers", "Suggested-question answers ready in the answer index", "gauge",
+    lambda: len(ai_service.answer_index)
+))
+REGISTRY.register(CallbackMetric(
+    "http_response_memo_lookups_total", "Memoized GET response lookups by result", "counter",
+    lambda: {("hit",): response_memo.hits, ("miss",): response_memo.misses},
+    labelnames=("result",)
+))
+REGISTRY.register(CallbackMetric(
+    "chat_sessions", "Chat sessions held in memory", "gauge",
+    lambda: len(session_store)
+))
+REGISTRY.register(CallbackMetric(
+    "admission_limit", "Current adaptive cap on in-flight chat requests", "gauge",
+    lambda: int(admission.limit)
+))
+REGISTRY.register(CallbackMetric(
+    "admission_in_flight", "Chat requests holding an admission slot", "gauge",
+    lambda: admission.in_flight
+))
+REGISTRY.register(CallbackMetric(
+    "admission_queue_depth", "Chat requests waiting for an admission slot", "gauge",
+    lambda: admission.queued
+))
+REGISTRY.register(CallbackMetric(
+    "chat_grounding_queue_depth", "Answers waiting for a grounding check", "gauge",
+    lambda: len(ai_service.grounding)
+))
+REGISTRY.register(CallbackMetric(
+    "rate_limiter_tracked_keys", "Client keys held by the rate limiter (as of the last sweep when shared)", "gauge",
+    lambda: len(rate_limiter)
+))
+
+
 # Helper Functions
-def check_rate_limit(client_ip: str) -> bool:
+def observe_validation(request: Request) -> None:
     """
-    Check if client has exceeded rate limit
-    Returns True if within limit, False if exceeded
-    """
-    current_time = time.time()
-    
-    # Clean old entries
-    rate_limit_storage[client_ip] = [
-        timestamp for timestamp in rate_limit_storage[client_ip]
-        if current_time - timestamp < RATE_LIMIT_WINDOW
-    ]
+    Record time from admission to handler entry (body read + validation)
     
-    # Check if limit exceeded
-    if len(rate_limit_storage[client_ip]) >= RATE_LIMIT_MAX_REQUESTS:
-        return False
-    
-    # Add current request
-    rate_limit_storage[client_ip].append(current_time)
-    return True
+    Measured from the slot being granted, the innermost middleware, so
+    neither the admission queue (admission_queue_wait_seconds) nor the
+    outer middleware are counted.
+    """
+    admitted_at = getattr(request.state, "admitted_at", None)
+    if admitted_at is not None:
+        elapsed = time.perf_counter() - admitted_at
+        REQUEST_VALIDATION_DURATION.observe(elapsed, route=request.url.path)
+        record_timing("validation_ms", elapsed)
 
 
 def sanitize_message(message: str) -> str:
@@ -101,6 +349,195 @@ def sanitize_message(message: str) -> str:
     return sanitized
 
 
+async def resolve_session(request: ChatRequest) -> Session:
+    """
+    Return the request's session, or start one
+
+    An unknown or expired session_id starts a fresh session (the response
+    carries the new id). Requests without a session_id seed the new session
+    from their conversation_history.
+    """
+    if request.session_id:
+        session = await session_store.get(request.session_id)
+        if session is not None:
+            return session
+    return session_store.create(request.conversation_history)
+
+
+def format_sse(event: str, data: Dict) -> str:
+    """Format a server-sent event frame"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+# Middleware (the last one registered runs first)
+
+# Admission control - upstream-backed routes wait for a slot, batch behind
+# interactive chats; everything else is served without queueing. Registered
+# first so body-size and rate-limit rejections never take a slot.
+ADMISSION_PRIORITIES = {
+    "/api/chat": 0,
+    "/api/chat/stream": 0,
+    "/api/chat/batch": 1,
+}
+admission = AdmissionController()
+app.add_middleware(
+    AdmissionMiddleware,
+    controller=admission,
+    priorities=ADMISSION_PRIORITIES,
+    unmeasured=("/api/chat/batch",)
+)
+
+
+@app.middleware("http")
+async def limit_chat_body_size(request: Request, call_next):
+    """Reject oversized chat payloads before the body is parsed and validated"""
+    if request.method == "POST" and request.url.path.startswith("/api/chat"):
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > MAX_CHAT_BODY_BYTES:
+            return JSONResponse(
+                status_code=413,
+                content={"detail": f"Request body exceeds {MAX_CHAT_BODY_BYTES} bytes"}
+            )
+    return await call_next(request)
+
+
+@app.middleware("http")
+async def rate_limit(request: Request, call_next):
+    """Apply the per-client rate limit to upstream-backed routes"""
+    if not request.url.path.startswith(RATE_LIMITED_PREFIXES):
+        return await call_next(request)
+    
+    result = await rate_limiter.hit(client_ip(request, TRUSTED_PROXY_HOPS))
+    if not result.allowed:
+        return JSONResponse(
+            status_code=429,
+            content={
+                "detail": f"Rate limit exceeded. Maximum {RATE_LIMIT_MAX_REQUESTS} requests per {int(RATE_LIMIT_WINDOW)} seconds."
+            },
+            headers={
+                "Retry-After": retry_after_header(result),
+                "X-RateLimit-Limit": str(RATE_LIMIT_MAX_REQUESTS),
+                "X-RateLimit-Remaining": "0"
+            }
+        )
+    
+    response = await call_next(request)
+    response.headers["X-RateLimit-Limit"] = str(RATE_LIMIT_MAX_REQUESTS)
+    response.headers["X-RateLimit-Remaining"] = str(result.remaining)
+    return response
+
+
+@app.middleware("http")
+async def http_caching(request: Request, call_next):
+    """
+    Per-route Cache-Control, response compression and memoized GET bodies
+    
+    Streamed responses (server-sent events, NDJSON) and responses that
+    already negotiate their own encoding or ETag (e.g. /api/portfolio-data)
+    pass through untouched.
+    """
+    cache_control = cache_policy(request.url.path)
+    memoize = (
+        request.method == "GET"
+        and cache_control is not None
+        and cache_control.startswith("public")
+        and request.url.path not in SELF_CACHED_PATHS
+    )
+    if memoize:
+        key = (content_store.current.version, request.url.path, request.url.query)
+        memoized = response_memo.get(key)
+        if memoized is not None:
+            payload, request.scope["route"] = memoized
+            return payload.response(request)
+    
+    response = await call_next(request)
+    headers = response.headers
+    if (
+        headers.get("content-type", "").startswith(STREAMING_MEDIA_TYPES)
+        or "content-encoding" in headers
+        or "etag" in headers
+    ):
+        return response
+    
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    if memoize and response.status_code == 200:
+        payload = CachedPayload(
+            body,
+            media_type=headers.get("content-type", "application/json"),
+            cache_control=cache_control,
+            compress_min_bytes=COMPRESS_MIN_BYTES,
+            headers={
+                name: value for name, value in headers.items()
+                if name not in ("content-length", "content-type", "cache-control", "vary")
+            }
+        )
+        response_memo.put(key, payload, request.scope.get("route"))
+        return payload.response(request)
+    
+    out_headers = {
+        name: value for name, value in headers.items()
+        if name not in ("content-length", "content-type")
+    }
+    if cache_control and "cache-control" not in headers:
+        # Errors from cacheable routes (e.g. unknown ids) are not cached
+        out_headers["Cache-Control"] = "no-store" if memoize else cache_control
+    if len(body) >= COMPRESS_MIN_BYTES:
+        coding = preferred_encoding(request.headers.get("accept-encoding"), AVAILABLE_ENCODINGS)
+        out_headers["Vary"] = VARY
+        if coding:
+            body = compress_body(body, coding)
+            out_headers["Content-Encoding"] = coding
+    return Response(
+        content=body,
+        status_code=response.status_code,
+        headers=out_headers,
+        media_type=headers.get("content-type")
+    )
+
+
+@app.middleware("http")
+async def record_metrics(request: Request, call_next):
+    """Per-route latency histogram, in-flight gauge and structured timing log"""
+    started = time.perf_counter()
+    timings = {}
+    token = request_timings.set(timings)
+    group = "chat" if request.url.path.startswith("/api/chat") else "other"
+    HTTP_REQUESTS_IN_FLIGHT.inc(group=group)
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        HTTP_REQUESTS_IN_FLIGHT.dec(group=group)
+        request_timings.reset(token)
+        # Label by route template, not raw path, to keep cardinality bounded
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", "unmatched")
+        duration = time.perf_counter() - started
+        HTTP_REQUEST_DURATION.observe(
+            duration, method=request.method, route=route_path, status=str(status_code)
+        )
+        log_request(request.method, route_path, status_code, duration, timings)
+
+
+# CORS Configuration - Update with your frontend domain
+# Registered last so it is the outermost layer: responses built by the
+# middleware above (memoized bodies, 413/429/503 rejections) get CORS headers too
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=[
+        "http://localhost:3000",  # Local development
+        "http://localhost:5173",  # Vite default port
+        "https://your-portfolio-domain.vercel.app",  # Update with your Vercel domain
+        "*"  # Remove in production, add specific domains
+    ],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
 # API Routes
 @app.get("/")
 async def root():
@@ -113,46 +550,110 @@ async def root():
 
 
 @app.get("/api/portfolio-data", response_model=PortfolioResponse)
-async def get_portfolio_data():
+async def get_portfolio_data(request: Request):
     """
     Get all portfolio data
     Returns bio, experience, projects, skills, and testimonials
+    
+    Served from a pre-serialized buffer with a strong ETag; requests with a
+    matching If-None-Match get 304 Not Modified.
     """
     try:
-        return {
-            "bio": PORTFOLIO_DATA["bio"],
-            "experience": PORTFOLIO_DATA["experience"],
-            "projects": PORTFOLIO_DATA["projects"],
-            "skills": PORTFOLIO_DATA["skills"],
-            "testimonials": PORTFOLIO_DATA["testimonials"]
-        }
+        return portfolio_payload.response(request)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching portfolio data: {str(e)}")
 
 
+@app.get("/api/portfolio-data/{section}")
+async def get_portfolio_section(
+    section: str,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    limit: int = Query(20, ge=1, le=100, description="Page size for list sections")
+):
+    """
+    Get a single portfolio section
+    
+    - bio, skills: the section object, optionally projected with fields=
+    - experience, projects, testimonials: a page of records
+      ({"items", "next_cursor", "total"}), each projected with fields=
+    """
+    if section not in SECTIONS:
+        raise HTTPException(status_code=404, detail=f"Unknown section: {section}")
+    
+    try:
+        if section in LIST_SECTIONS:
+            return content_store.current.index.page(section, cursor=cursor, limit=limit, fields=parse_fields(fields))
+        return content_store.current.index.section(section, fields=parse_fields(fields))
+    except InvalidQuery as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/api/projects")
+async def get_projects_by_tech(
+    tech: str = Query(..., min_length=1, description="Technology name, e.g. React"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return")
+):
+    """Get the projects built with a technology (case- and .js-insensitive, indexed lookup)"""
+    projects = content_store.current.index.projects_using(tech)
+    try:
+        selected = parse_fields(fields)
+        items = [project_fields(project, selected) for project in projects]
+    except InvalidQuery as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "total": len(items)}
+
+
+@app.get("/api/projects/{project_id}")
+async def get_project(
+    project_id: str,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return")
+):
+    """Get one project's details by id"""
+    project = content_store.current.index.get_project(project_id)
+    if project is None:
+        raise HTTPException(status_code=404, detail=f"Project not found: {project_id}")
+    try:
+        return project_fields(project, parse_fields(fields))
+    except InvalidQuery as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/api/experience/{experience_id}")
+async def get_experience(
+    experience_id: str,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return")
+):
+    """Get one experience entry by id"""
+    experience = content_store.current.index.get_experience(experience_id)
+    if experience is None:
+        raise HTTPException(status_code=404, detail=f"Experience not found: {experience_id}")
+    try:
+        return project_fields(experience, parse_fields(fields))
+    except InvalidQuery as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.post("/api/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
+async def chat(request: ChatRequest, http_request: Request):
     """
     Handle chat conversations with AI assistant
     
     Request body:
     - message: User's message (required, 1-1000 characters)
-    - conversation_history: Previous messages (optional)
+    - session_id: Session id returned by a previous response (optional)
+    - conversation_history: Previous messages (optional, ignored with a live session_id)
     
     Returns:
     - response: AI assistant's response
     - timestamp: ISO format timestamp
     - suggested_questions: Optional list of follow-up questions
+    - session_id: Session holding this conversation's history
     """
+    observe_validation(http_request)
+    
     try:
-        # Rate limiting check
-        # In production, get real IP from request headers
-        # client_ip = request.client.host if hasattr(request, 'client') else client_host
-        # if not check_rate_limit(client_ip):
-        #     raise HTTPException(
-        #         status_code=429,
-        #         detail="Rate limit exceeded. Maximum 20 requests per minute."
-        #     )
+        # Rate limiting is applied by the rate_limit middleware
         
         # Sanitize input
         sanitized_message = sanitize_message(request.message)
@@ -160,39 +661,154 @@ async def chat(request: ChatRequest):
         if not sanitized_message:
             raise HTTPException(status_code=400, detail="Message cannot be empty")
         
-        # Convert Pydantic models to dict format for AI service
-        history = [
-            {"role": msg.role, "content": msg.content}
-            for msg in request.conversation_history
-        ]
+        session = await resolve_session(request)
+        first_message = not session.turns
         
-        # Get AI response
+        # Get AI response (history is compacted by the service, no copy needed here)
         ai_response = await ai_service.get_ai_response(
             user_message=sanitized_message,
-            conversation_history=history
+            conversation_history=session.history()
         )
+        session.append(sanitized_message, ai_response)
+        await session_store.save(session)
         
         # Get suggested questions (only for first message)
         suggested_questions = None
-        if len(request.conversation_history) == 0:
+        if first_message:
             suggested_questions = ai_service.get_suggested_questions()
         
         return ChatResponse(
             response=ai_response,
             timestamp=datetime.now().isoformat(),
-            suggested_questions=suggested_questions
+            suggested_questions=suggested_questions,
+            session_id=session.id
         )
         
     except HTTPException:
         raise
+    except AIServiceNotConfigured:
+        raise HTTPException(status_code=503, detail="The AI assistant is not available right now.")
     except Exception as e:
-        print(f"Error in chat endpoint: {str(e)}")
+        logger.error("Error in chat endpoint: %s", e)
         raise HTTPException(
             status_code=500,
             detail="An error occurred processing your request. Please try again."
         )
 
 
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest, http_request: Request):
+    """
+    Stream the AI assistant's response as server-sent events
+    
+    Request body is the same as /api/chat.
+    
+    Events:
+    - token: {"content": "..."} for each generated text delta
+    - done: the full ChatResponse (response, timestamp, suggested_questions, session_id)
+    - error: {"detail": "..."} if the upstream call fails mid-stream
+    
+    If the client disconnects, the response generator is cancelled and the
+    upstream Groq stream is closed with it.
+    """
+    observe_validation(http_request)
+    
+    sanitized_message = sanitize_message(request.message)
+    
+    if not sanitized_message:
+        raise HTTPException(status_code=400, detail="Message cannot be empty")
+    if not ai_service.configured:
+        raise HTTPException(status_code=503, detail="The AI assistant is not available right now.")
+    
+    session = await resolve_session(request)
+    first_message = not session.turns
+    
+    async def event_stream():
+        chunks = []
+        try:
+            async for token in ai_service.stream_ai_response(
+                user_message=sanitized_message,
+                conversation_history=session.history()
+            ):
+                chunks.append(token)
+                yield format_sse("token", {"content": token})
+        except Exception as e:
+            logger.error("Error in chat stream endpoint: %s", e)
+            yield format_sse("error", {
+                "detail": "An error occurred processing your request. Please try again."
+            })
+            return
+        
+        # Only completed answers become part of the session
+        response = "".join(chunks)
+        session.append(sanitized_message, response)
+        await session_store.save(session)
+        
+        suggested_questions = None
+        if first_message:
+            suggested_questions = ai_service.get_suggested_questions()
+        
+        final = ChatResponse(
+            response=response,
+            timestamp=datetime.now().isoformat(),
+            suggested_questions=suggested_questions,
+            session_id=session.id
+        )
+        yield format_sse("done", final.model_dump())
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Disable proxy buffering so tokens flush immediately
+        }
+    )
+
+
+@app.post("/api/chat/batch")
+async def chat_batch(request: ChatBatchRequest, http_request: Request):
+    """
+    Answer many independent questions in one call, streamed as NDJSON
+    
+    Meant for evaluation runs after content changes. Requires
+    `Authorization: Bearer <CHAT_BATCH_TOKEN>`; the route is disabled while
+    CHAT_BATCH_TOKEN is unset.
+    
+    Each question is answered as a first message (no history or session).
+    One JSON line per question is written in request order as soon as it
+    and every earlier question are answered:
+    {"index": 0, "question": "...", "response": "...", "error": null}
+    A failed question carries an error instead of failing the batch; while
+    the upstream is failing, questions get an error rather than the
+    portfolio fallback answer chat visitors see.
+    """
+    observe_validation(http_request)
+    
+    if not CHAT_BATCH_TOKEN:
+        raise HTTPException(status_code=403, detail="Batch chat is disabled")
+    scheme, _, token = http_request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(token.encode(), CHAT_BATCH_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid batch token")
+    if not ai_service.configured:
+        raise HTTPException(status_code=503, detail="The AI assistant is not available right now.")
+    
+    questions = [sanitize_message(question) for question in request.questions]
+    
+    async def lines():
+        async for item in ai_service.answer_batch(questions):
+            yield json.dumps(asdict(item)) + "\n"
+    
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
 @app.get("/api/suggested-questions")
 async def get_suggested_questions():
     """Get a list of suggested questions for the chat"""
@@ -206,7 +822,7 @@ async def get_suggested_questions():
 
 @app.get("/api/health")
 async def health_check():
-    """Health check endpoint for monitoring"""
+    """Liveness check - the process is up and serving requests"""
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
@@ -214,6 +830,44 @@ async def health_check():
     }
 
 
+@app.get("/api/ready")
+async def readiness_check():
+    """
+    Readiness check - the AI assistant can serve chats
+    
+    Returns 503 while the upstream client is still warming up, when
+    GROQ_API_KEY is not configured.
+    """
+    if not ai_service.configured:
+        status = "not_configured"
+    elif not ai_service.ready:
+        status = "starting"
+    else:
+        status = "ready"
+    
+    body = {
+        "status": status,
+        "timestamp": datetime.now().isoformat(),
+        "import_ms": IMPORT_MS,
+        "prompt_version": ai_service.prompt_version,
+        "content": content_store.stats(),
+        "upstream_circuit": ai_service.breaker.state,
+        "models": ai_service.router.snapshot(),
+        "pid": os.getpid(),
+        "admission": admission.stats(),
+        "sessions": session_store.stats(),
+        "answer_index": ai_service.answer_index.stats(),
+        "response_cache": ai_service.response_cache.stats()
+    }
+    return JSONResponse(status_code=200 if status == "ready" else 503, content=body)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
 # Error handlers
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
@@ -0,0 +1,327 @@
+"""
+Metrics - Lightweight Prometheus instrumentation
+Latency histograms, token counters and gauges rendered in the Prometheus
+text exposition format, plus per-request timing logs
+"""
+
+import json
+import time
+import logging
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+
+timing_logger = logging.getLogger("portfolio.timing")
+
+# Timings collected for the request being handled (set by the metrics middleware)
+request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_timings", default=None)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30)
+FAST_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        """Sample lines in the text exposition format, without the header"""
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in self._values.items()
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in self._values.items()
+        ]
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket latency/size distribution"""
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts..., +Inf count], sum
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = ([0] * (len(self.buckets) + 1), [0.0])
+            self._values[key] = state
+        counts, total = state
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def render(self) -> List[str]:
+        lines = []
+        for key, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total[0])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class CallbackMetric(_Metric):
+    """Metric whose value is read from a callback at scrape time"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        callback: Callable[[], Union[float, Dict[LabelValues, float]]],
+        labelnames: Sequence[str] = ()
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self.callback = callback
+
+    def render(self) -> List[str]:
+        value = self.callback()
+        if not isinstance(value, dict):
+            value = {(): value}
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(val)}"
+            for key, val in value.items()
+        ]
+
+
+class Registry:
+    """Collection of metrics rendered together at /metrics"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            try:
+                samples = metric.render()
+            except Exception:
+                timing_logger.exception("Failed to collect metric %s", metric.name)
+                continue
+            lines.extend(metric.header())
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# HTTP layer
+HTTP_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "http_request_duration_seconds",
+    "Time to response headers per route",
+    labelnames=("method", "route", "status")
+))
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.register(Gauge(
+    "http_requests_in_flight",
+    "Requests currently being handled, by route group (chat or other)",
+    labelnames=("group",)
+))
+REQUEST_VALIDATION_DURATION = REGISTRY.register(Histogram(
+    "request_validation_duration_seconds",
+    "Time from admission to handler entry (body read and validation), excluding queueing",
+    labelnames=("route",),
+    buckets=FAST_BUCKETS
+))
+
+# Chat pipeline
+PROMPT_BUILD_DURATION = REGISTRY.register(Histogram(
+    "chat_prompt_build_duration_seconds",
+    "Time to compact history, retrieve context and assemble upstream messages",
+    buckets=FAST_BUCKETS
+))
+UPSTREAM_DURATION = REGISTRY.register(Histogram(
+    "groq_request_duration_seconds",
+    "Total upstream Groq call duration per attempt",
+    labelnames=("model", "mode", "outcome")
+))
+UPSTREAM_TTFT = REGISTRY.register(Histogram(
+    "groq_time_to_first_token_seconds",
+    "Time from starting a streaming upstream call to the first token",
+    labelnames=("model",)
+))
+UPSTREAM_TOKENS = REGISTRY.register(Counter(
+    "groq_tokens_total",
+    "Tokens reported by the Groq usage field",
+    labelnames=("model", "kind")
+))
+CHAT_ANSWERS = REGISTRY.register(Counter(
+    "chat_answers_total",
+    "Chat answers by source",
+    labelnames=("source",)
+))
+CHAT_ROUTES = REGISTRY.register(Counter(
+    "chat_routes_total",
+    "Upstream chat calls by routed model and question tier",
+    labelnames=("model", "tier")
+))
+
+# Admission control on the chat routes
+ADMISSION_DECISIONS = REGISTRY.register(Counter(
+    "admission_decisions_total",
+    "Chat admission outcomes (admitted, queued, queue_full, expected_wait, deadline)",
+    labelnames=("result",)
+))
+ADMISSION_QUEUE_WAIT = REGISTRY.register(Histogram(
+    "admission_queue_wait_seconds",
+    "Time queued requests waited for a slot, whether admitted or shed"
+))
+
+# Answer grounding (checked in the background after responses are sent)
+GROUNDING_CHECKS = REGISTRY.register(Counter(
+    "chat_grounding_checks_total",
+    "Answers checked against the portfolio data by result (grounded, ungrounded, dropped)",
+    labelnames=("result",)
+))
+GROUNDING_UNGROUNDED = REGISTRY.register(Counter(
+    "chat_grounding_ungrounded_entities_total",
+    "Entities mentioned in answers that the portfolio data does not support",
+    labelnames=("kind",)
+))
+GROUNDING_DURATION = REGISTRY.register(Histogram(
+    "chat_grounding_check_duration_seconds",
+    "Time to extract and check the entities of one answer",
+    buckets=FAST_BUCKETS
+))
+
+
+def record_timing(name: str, seconds: float) -> None:
+    """Attach a timing (in seconds) to the current request's timing log"""
+    timings = request_timings.get()
+    if timings is not None:
+        timings[name] = round(seconds * 1000, 3)
+
+
+def record_value(name: str, value: float) -> None:
+    """Attach a non-timing value (e.g. token counts) to the current request's timing log"""
+    timings = request_timings.get()
+    if timings is not None:
+        timings[name] = value
+
+
+def record_usage(model: str, usage) -> None:
+    """Count prompt/completion tokens from a Groq usage object, if present"""
+    if usage is None:
+        return
+    prompt_tokens = getattr(usage, "prompt_tokens", None) or 0
+    completion_tokens = getattr(usage, "completion_tokens", None) or 0
+    UPSTREAM_TOKENS.inc(prompt_tokens, model=model, kind="prompt")
+    UPSTREAM_TOKENS.inc(completion_tokens, model=model, kind="completion")
+    record_value("prompt_tokens", prompt_tokens)
+    record_value("completion_tokens", completion_tokens)
+
+
+def log_request(method: str, route: str, status: int, duration: float, timings: Dict[str, float]) -> None:
+    """Emit one structured timing log line per request"""
+    if not timing_logger.isEnabledFor(logging.INFO):
+        return
+    record = {
+        "method": method,
+        "route": route,
+        "status": status,
+        "duration_ms": round(duration * 1000, 3),
+        **timings
+    }
+    timing_logger.info(json.dumps(record, separators=(",", ":")))
+
+
+class Timer:
+    """Context manager measuring elapsed seconds with perf_counter"""
+
+    __slots__ = ("started", "elapsed")
+
+    def __enter__(self) -> "Timer":
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.elapsed = time.perf_counter() - self.started
@@ -0,0 +1,229 @@
+"""
+Model Router - Per-question model selection
+Answers contact questions straight from the bio, sends simple questions to a
+small fast model and heavier ones to the large model, and steers traffic
+away from models that are currently slow or failing
+"""
+
+import os
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+GROQ_LARGE_MODEL = os.environ.get("GROQ_LARGE_MODEL", "llama-3.3-70b-versatile")
+GROQ_SMALL_MODEL = os.environ.get("GROQ_SMALL_MODEL", "llama-3.1-8b-instant")
+
+# Questions longer than this, or whose prompt exceeds the budget, go to the large model
+SIMPLE_MAX_WORDS = int(os.environ.get("ROUTER_SIMPLE_MAX_WORDS", "20"))
+SMALL_MODEL_PROMPT_BUDGET = int(os.environ.get("ROUTER_SMALL_PROMPT_BUDGET", "2500"))
+
+# Completion caps per tier
+SIMPLE_MAX_TOKENS = 512
+COMPLEX_MAX_TOKENS = 1024
+
+# Health tracking: outcomes older than the window are forgotten, so a model
+# marked unhealthy gets traffic again once its failures age out
+ROUTER_WINDOW_SECONDS = float(os.environ.get("ROUTER_WINDOW_SECONDS", "60"))
+ROUTER_MIN_SAMPLES = 5
+ROUTER_MAX_ERROR_RATE = 0.5
+LATENCY_EWMA_ALPHA = 0.2
+
+SIMPLE = "simple"
+COMPLEX = "complex"
+
+# Phrases that ask for reasoning, comparison or depth
+COMPLEX_HINTS = re.compile(
+    r"\b(compare|comparison|explain|why|how (did|does|do|would|could)|architecture|design(ed)?|"
+    r"trade-?offs?|walk me through|in detail|detailed|differences?|most complex|challenges?|"
+    r"approach|pros and cons|step by step|deep dive)\b"
+)
+
+# Contact intents and the words that signal them
+CONTACT_INTENTS = {
+    "email": {"email", "mail"},
+    "contact": {"contact", "reach", "touch"},
+    "linkedin": {"linkedin"},
+    "github": {"github"},
+    "location": {"located", "location", "based", "live", "where", "city", "country"},
+    "availability": {"available", "availability", "hire", "hiring", "opportunities", "open"},
+}
+
+# Words allowed around a contact intent; anything else means the question
+# is about more than contact details and needs the model
+CONTACT_FILLER = {
+    "a", "an", "and", "are", "ask", "at", "be", "can", "could", "currently", "do", "e",
+    "for", "get", "give", "hey", "hi", "how", "i", "in", "is", "it", "link", "may", "me",
+    "now", "of", "on", "or", "please", "profile", "right", "s", "share", "so", "tell",
+    "the", "there", "to", "url", "what", "whats", "with", "would", "you", "your", "address",
+    "account", "handle", "page", "id",
+}
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+@dataclass(frozen=True)
+class Route:
+    """Where a question is sent"""
+    model: str
+    tier: str
+    max_tokens: int
+
+
+def contact_intents(message: str) -> List[str]:
+    """
+    Return the contact intents of a question made only of contact words
+
+    Returns an empty list when any word falls outside the contact vocabulary,
+    e.g. "tell me about your GitHub projects".
+    """
+    words = _WORD_RE.findall(message.lower())
+    if not words or len(words) > 12:
+        return []
+
+    intents = []
+    for word in words:
+        matched = [intent for intent, keywords in CONTACT_INTENTS.items() if word in keywords]
+        if not matched and word not in CONTACT_FILLER:
+            return []
+        for intent in matched:
+            if intent not in intents:
+                intents.append(intent)
+    return intents
+
+
+def direct_answer(message: str, data: Dict[str, Any]) -> Optional[str]:
+    """Answer contact questions from the bio without calling a model"""
+    intents = contact_intents(message)
+    if not intents:
+        return None
+
+    bio = data["bio"]
+    name = bio["name"]
+    parts = []
+    if "email" in intents or "contact" in intents:
+        parts.append(f"You can reach {name} by email at {bio['email']}.")
+    if "linkedin" in intents or "contact" in intents:
+        parts.append(f"LinkedIn: {bio['linkedin']}")
+    if "github" in intents:
+        parts.append(f"GitHub: {bio['github']}")
+    if "location" in intents:
+        parts.append(f"{name} is based in {bio['location']}.")
+    if "availability" in intents:
+        parts.append(f"Availability: {bio['availability']}. Get in touch at {bio['email']}.")
+    return " ".join(parts) if parts else None
+
+
+def classify(message: str, prompt_tokens: int) -> str:
+    """Estimate whether a question is simple or complex"""
+    if prompt_tokens > SMALL_MODEL_PROMPT_BUDGET:
+        return COMPLEX
+    if len(message.split()) > SIMPLE_MAX_WORDS or message.count("?") > 1:
+        return COMPLEX
+    if COMPLEX_HINTS.search(message.lower()):
+        return COMPLEX
+    return SIMPLE
+
+
+class ModelStats:
+    """Rolling outcomes and smoothed latency for one model"""
+
+    def __init__(self, window_seconds: float = ROUTER_WINDOW_SECONDS):
+        self.window_seconds = window_seconds
+        self.latency: Optional[float] = None
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+
+    def record(self, latency: float, ok: bool) -> None:
+        now = time.monotonic()
+        self._outcomes.append((now, ok))
+        self._expire(now)
+        if ok:
+            self.latency = latency if self.latency is None else (
+                LATENCY_EWMA_ALPHA * latency + (1 - LATENCY_EWMA_ALPHA) * self.latency
+            )
+
+    def _expire(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+    @property
+    def samples(self) -> int:
+        self._expire(time.monotonic())
+        return len(self._outcomes)
+
+    @property
+    def error_rate(self) -> float:
+        samples = self.samples
+        if not samples:
+            return 0.0
+        return sum(1 for _, ok in self._outcomes if not ok) / samples
+
+    @property
+    def recent_latency(self) -> Optional[float]:
+        """Smoothed latency, or None if the model has no outcomes in the window"""
+        return self.latency if self.samples else None
+
+    @property
+    def healthy(self) -> bool:
+        return self.samples < ROUTER_MIN_SAMPLES or self.error_rate <= ROUTER_MAX_ERROR_RATE
+
+
+class ModelRouter:
+    """
+    Picks a model per question
+
+    - simple questions: the small model, or the large one if it is healthy
+      and currently faster (or the small one is unhealthy)
+    - complex questions: the large model, degrading to the small one only
+      while the large model is unhealthy
+    """
+
+    def __init__(self, small_model: str = GROQ_SMALL_MODEL, large_model: str = GROQ_LARGE_MODEL):
+        self.small_model = small_model
+        self.large_model = large_model
+        self.stats: Dict[str, ModelStats] = {
+            small_model: ModelStats(),
+            large_model: ModelStats()
+        }
+
+    def route(self, message: str, prompt_tokens: int) -> Route:
+        tier = classify(message, prompt_tokens)
+        if tier == COMPLEX:
+            model = self._pick(self.large_model, self.small_model, by_latency=False)
+            return Route(model, tier, COMPLEX_MAX_TOKENS)
+        model = self._pick(self.small_model, self.large_model, by_latency=True)
+        return Route(model, tier, SIMPLE_MAX_TOKENS)
+
+    def _pick(self, preferred: str, alternate: str, by_latency: bool) -> str:
+        if preferred == alternate:
+            return preferred
+        first, second = self.stats[preferred], self.stats[alternate]
+        if not first.healthy and second.healthy:
+            return alternate
+        # Stale latencies are ignored, so a model that lost traffic for being
+        # slow is tried again once its window empties
+        first_latency, second_latency = first.recent_latency, second.recent_latency
+        if (
+            by_latency and second.healthy
+            and first_latency is not None and second_latency is not None
+            and second_latency < first_latency
+        ):
+            return alternate
+        return preferred
+
+    def record(self, model: str, latency: float, ok: bool) -> None:
+        """Record one upstream attempt's latency and outcome"""
+        self.stats.setdefault(model, ModelStats()).record(latency, ok)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            model: {
+                "latency_ms": round(stats.latency * 1000, 1) if stats.latency is not None else None,
+                "error_rate": round(stats.error_rate, 3),
+                "samples": stats.samples,
+                "healthy": stats.healthy
+            }
+            for model, stats in self.stats.items()
+        }
@@ -0,0 +1,134 @@
+"""
+Portfolio Index - Lookup and pagination over portfolio sections
+Built once per content snapshot so per-record requests don't scan the data
+"""
+
+import json
+import base64
+import binascii
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+SECTIONS = ("bio", "experience", "projects", "skills", "testimonials")
+LIST_SECTIONS = ("experience", "projects", "testimonials")
+
+
+class InvalidQuery(ValueError):
+    """Raised for malformed field selections or pagination cursors"""
+
+
+def encode_cursor(section: str, offset: int) -> str:
+    """Encode an opaque pagination cursor"""
+    raw = json.dumps({"s": section, "o": offset}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(section: str, cursor: str) -> int:
+    """Decode a pagination cursor issued for the given section"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        offset = int(payload["o"])
+        if payload["s"] != section or offset < 0:
+            raise ValueError
+    except (ValueError, KeyError, TypeError, binascii.Error, UnicodeError):
+        raise InvalidQuery("Invalid cursor")
+    return offset
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Parse a comma-separated fields= parameter"""
+    if not fields:
+        return None
+    selected = tuple(name.strip() for name in fields.split(",") if name.strip())
+    return selected or None
+
+
+def project_fields(record: Dict[str, Any], fields: Optional[Iterable[str]]) -> Dict[str, Any]:
+    """Return only the requested fields of a record (all fields if None)"""
+    if fields is None:
+        return record
+    unknown = [name for name in fields if name not in record]
+    if unknown:
+        raise InvalidQuery(f"Unknown fields: {', '.join(unknown)}")
+    return {name: record[name] for name in fields}
+
+
+def normalize_tech(name: str) -> str:
+    """
+    Key for technology lookups
+
+    Case- and whitespace-insensitive, and ignores a ".js" suffix, so
+    "React", "react.js" and "React JS" are the same technology.
+    """
+    key = " ".join(name.lower().split())
+    for suffix in (".js", " js"):
+        if key.endswith(suffix) and len(key) > len(suffix):
+            return key[:-len(suffix)]
+    return key
+
+
+class PortfolioIndex:
+    """
+    Precomputed lookups and paginated views over the portfolio sections
+
+    - id -> project / experience entry
+    - technology -> projects using it
+    - skill category -> skills
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.projects_by_id = {str(proj["id"]): proj for proj in data["projects"]}
+        self.experience_by_id = {str(exp["id"]): exp for exp in data["experience"]}
+
+        projects_by_tech: Dict[str, List[Dict[str, Any]]] = {}
+        for proj in data["projects"]:
+            for tech in proj.get("tech", ()):
+                projects = projects_by_tech.setdefault(normalize_tech(tech), [])
+                # A project listing both "React" and "React.js" appears once
+                if not projects or projects[-1] is not proj:
+                    projects.append(proj)
+        self.projects_by_tech = {tech: tuple(projs) for tech, projs in projects_by_tech.items()}
+        self.skills_by_category = {
+            category: tuple(skills) for category, skills in data["skills"].items()
+        }
+
+    def get_project(self, project_id: str) -> Optional[Dict[str, Any]]:
+        return self.projects_by_id.get(project_id)
+
+    def projects_using(self, tech: str) -> Tuple[Dict[str, Any], ...]:
+        """Projects listing the given technology (see normalize_tech)"""
+        return self.projects_by_tech.get(normalize_tech(tech), ())
+
+    def skills_in(self, category: str) -> Tuple[str, ...]:
+        return self.skills_by_category.get(category, ())
+
+    def get_experience(self, experience_id: str) -> Optional[Dict[str, Any]]:
+        return self.experience_by_id.get(experience_id)
+
+    def section(self, name: str, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Return a dict section (bio, skills), optionally projected"""
+        return project_fields(self.data[name], fields)
+
+    def page(
+        self,
+        name: str,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        fields: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return one page of a list section
+
+        Returns:
+            {"items": [...], "next_cursor": str or None, "total": int}
+        """
+        records: List[Dict[str, Any]] = self.data[name]
+        offset = decode_cursor(name, cursor) if cursor else 0
+        end = offset + limit
+        return {
+            "items": [project_fields(record, fields) for record in records[offset:end]],
+            "next_cursor": encode_cursor(name, end) if end < len(records) else None,
+            "total": len(records)
+        }
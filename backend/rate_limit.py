@@ -0,0 +1,163 @@
+"""
+Rate Limiting - Token bucket limiter with pluggable storage
+Protects the upstream Groq quota from bursty clients
+"""
+
+import math
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from starlette.requests import Request
+
+from shared_state import SQLiteDatabase
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    remaining: int
+    retry_after: float  # seconds until the next request would be allowed
+
+
+class RateLimiter(ABC):
+    """
+    Token bucket rate limiter interface
+
+    Each key owns a bucket of `capacity` tokens refilled continuously over
+    `window_seconds`, which allows short bursts while holding the long-run
+    rate to capacity / window. Backends decide where bucket state lives: an
+    in-process dict for a single worker, or a shared store across workers.
+    """
+
+    def __init__(self, capacity: int, window_seconds: float):
+        self.capacity = capacity
+        self.window_seconds = window_seconds
+        self.refill_rate = capacity / window_seconds  # tokens per second
+
+    @abstractmethod
+    async def hit(self, key: str) -> RateLimitResult:
+        """Consume one token for key if available"""
+
+    def _take(self, tokens: float, updated: float, now: float) -> Tuple[float, RateLimitResult]:
+        """Refill a bucket up to now and try to take a token; returns the new token count"""
+        tokens = min(self.capacity, tokens + (now - updated) * self.refill_rate)
+        if tokens >= 1:
+            tokens -= 1
+            return tokens, RateLimitResult(True, int(tokens), 0.0)
+        return tokens, RateLimitResult(False, 0, (1 - tokens) / self.refill_rate)
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """
+    Per-process token buckets
+
+    State is two floats per key. Keys whose bucket has fully refilled carry no
+    information and are swept out every `sweep_interval` seconds, so memory is
+    bounded by the number of clients active within one window.
+    """
+
+    def __init__(self, capacity: int, window_seconds: float, sweep_interval: float = 60):
+        super().__init__(capacity, window_seconds)
+        self.sweep_interval = sweep_interval
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._last_sweep = time.monotonic()
+
+    async def hit(self, key: str) -> RateLimitResult:
+        now = time.monotonic()
+        if now - self._last_sweep >= self.sweep_interval:
+            self.sweep(now)
+
+        tokens, updated = self._buckets.get(key, (self.capacity, now))
+        tokens, result = self._take(tokens, updated, now)
+        self._buckets[key] = (tokens, now)
+        return result
+
+    def sweep(self, now: float) -> None:
+        """Evict keys that have been idle long enough to refill completely"""
+        full_refill = self.window_seconds
+        idle = [key for key, (_, updated) in self._buckets.items() if now - updated >= full_refill]
+        for key in idle:
+            del self._buckets[key]
+        self._last_sweep = now
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class SQLiteRateLimiter(RateLimiter):
+    """
+    Token buckets shared by every worker process through a SQLite file
+
+    Each hit is one read-modify-write under BEGIN IMMEDIATE, so concurrent
+    workers never lose each other's updates. Bucket times are wall-clock,
+    since monotonic clocks are not comparable across processes. The number
+    of tracked keys is counted during the periodic sweep, off the event
+    loop, so len() (read by a metrics gauge) never queries the database.
+    """
+
+    def __init__(self, db: SQLiteDatabase, capacity: int, window_seconds: float, sweep_interval: float = 60):
+        super().__init__(capacity, window_seconds)
+        self.db = db
+        self.sweep_interval = sweep_interval
+        self._last_sweep = time.time()
+        with db.transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            self._tracked = self._count(conn, self._last_sweep)
+
+    async def hit(self, key: str) -> RateLimitResult:
+        return await self.db.run(self._hit, key)
+
+    def _hit(self, key: str) -> RateLimitResult:
+        now = time.time()
+        with self.db.transaction() as conn:
+            sweep = now - self._last_sweep >= self.sweep_interval
+            if sweep:
+                conn.execute("DELETE FROM rate_limit_buckets WHERE updated <= ?", (now - self.window_seconds,))
+                self._last_sweep = now
+            row = conn.execute("SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?", (key,)).fetchone()
+            tokens, updated = row if row else (self.capacity, now)
+            tokens, result = self._take(tokens, min(updated, now), now)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                (key, tokens, now)
+            )
+            if sweep:
+                self._tracked = self._count(conn, now)
+        return result
+
+    def _count(self, conn, now: float) -> int:
+        return conn.execute(
+            "SELECT COUNT(*) FROM rate_limit_buckets WHERE updated > ?", (now - self.window_seconds,)
+        ).fetchone()[0]
+
+    def __len__(self) -> int:
+        """Keys active within one window, as of the last sweep (at most sweep_interval old)"""
+        return self._tracked
+
+
+def client_ip(request: Request, trusted_proxy_hops: int = 0) -> str:
+    """
+    Resolve the client IP address
+
+    Behind N trusted reverse proxies, each proxy appends the address it
+    received the request from to X-Forwarded-For, so the real client is the
+    Nth entry from the right. Entries further left are client-supplied and
+    cannot be trusted.
+    """
+    if trusted_proxy_hops > 0:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+            if hops:
+                return hops[-min(trusted_proxy_hops, len(hops))]
+    return request.client.host if request.client else "unknown"
+
+
+def retry_after_header(result: RateLimitResult) -> str:
+    """Format Retry-After as whole seconds (rounded up)"""
+    return str(max(1, math.ceil(result.retry_after)))
@@ -0,0 +1,138 @@
+"""
+Upstream Resilience - Retries, deadlines and circuit breaking
+Keeps chat latency bounded when the Groq API is slow or failing
+"""
+
+import time
+import random
+import asyncio
+from typing import Awaitable, Callable, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limiting, server errors
+TRANSIENT_STATUS_CODES = frozenset({408, 409, 429})
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Return True for upstream errors that may succeed on retry"""
+    if isinstance(exc, asyncio.TimeoutError):
+        return True
+
+    # Imported lazily so this module does not pull in the HTTP stack by itself
+    import httpx
+    import groq
+    if isinstance(exc, (httpx.TimeoutException, httpx.TransportError)):
+        return True
+    if isinstance(exc, groq.APIConnectionError):  # includes APITimeoutError
+        return True
+    if isinstance(exc, groq.APIStatusError):
+        return exc.status_code in TRANSIENT_STATUS_CODES or exc.status_code >= 500
+    return False
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    - closed: calls flow; `failure_threshold` consecutive failures open it
+    - open: calls are rejected until `reset_timeout` seconds have passed
+    - half_open: one trial call is let through; success closes the
+      breaker, failure re-opens it
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed now"""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._state = self.CLOSED
+        self._failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._trial_in_flight = False
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Release a half-open trial slot without recording an outcome (e.g. cancellation)"""
+        self._trial_in_flight = False
+
+
+async def call_with_retries(
+    call: Callable[[], Awaitable[T]],
+    attempts: int = 3,
+    attempt_timeout: float = 10,
+    deadline: Optional[float] = None,
+    base_delay: float = 0.25,
+    max_delay: float = 2.0,
+    is_transient: Callable[[BaseException], bool] = is_transient_error
+) -> T:
+    """
+    Run an async call with per-attempt timeouts and jittered exponential backoff
+
+    Args:
+        call: Zero-argument coroutine factory, invoked once per attempt
+        attempts: Maximum number of attempts
+        attempt_timeout: Seconds allowed for each attempt
+        deadline: Total seconds allowed across all attempts and backoff
+        base_delay: Backoff before the second attempt (doubles each retry)
+        max_delay: Cap on a single backoff delay
+        is_transient: Predicate deciding whether an error is retried
+
+    Returns:
+        The result of the first successful attempt
+
+    Raises:
+        The last error once attempts or the deadline are exhausted, or
+        immediately for non-transient errors
+    """
+    started = time.monotonic()
+    for attempt in range(1, attempts + 1):
+        timeout = attempt_timeout
+        if deadline is not None:
+            timeout = min(timeout, deadline - (time.monotonic() - started))
+            if timeout <= 0:
+                raise asyncio.TimeoutError("Upstream deadline exceeded")
+
+        try:
+            return await asyncio.wait_for(call(), timeout=timeout)
+        except Exception as e:
+            if attempt == attempts or not is_transient(e):
+                raise
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+            delay = random.uniform(delay / 2, delay)
+            if deadline is not None and time.monotonic() - started + delay >= deadline:
+                raise
+            await asyncio.sleep(delay)
+
+    raise RuntimeError("unreachable")
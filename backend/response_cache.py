@@ -0,0 +1,239 @@
+"""
+Response Cache - Chat answer caching
+Serves repeated (and near-duplicate) chat questions without an upstream call
+"""
+
+import re
+import time
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+
+_NON_WORD = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+# Filler words a near-duplicate question may add, drop or swap. Negations are
+# deliberately absent: "did you use" and "did you not use" must never match.
+_FILLER_WORDS = frozenset({
+    "a", "an", "the", "and", "or", "of", "in", "on", "at", "to", "for", "with", "about", "from",
+    "is", "are", "was", "were", "be", "been", "do", "does", "did", "have", "has", "had",
+    "can", "could", "would", "will", "please", "tell", "me", "i", "you", "your", "he", "his",
+    "what", "which", "how", "this", "that", "it", "its", "any", "some", "there", "so", "just",
+})
+
+
+def normalize_message(message: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace"""
+    message = _NON_WORD.sub(" ", message.lower())
+    return _WHITESPACE.sub(" ", message).strip()
+
+
+def history_fingerprint(conversation_history: List[Dict[str, str]]) -> str:
+    """Hash the conversation history that is sent upstream"""
+    digest = hashlib.sha256()
+    for msg in conversation_history:
+        digest.update(msg["role"].encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(msg["content"].encode("utf-8"))
+        digest.update(b"\x01")
+    return digest.hexdigest()[:16]
+
+
+def content_words(normalized: str) -> FrozenSet[str]:
+    """Words and numbers of a normalized message that carry its meaning"""
+    return frozenset(word for word in normalized.split() if word not in _FILLER_WORDS)
+
+
+def _trigrams(text: str) -> FrozenSet[str]:
+    """Character trigrams used by the similarity tier"""
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+@dataclass
+class _Entry:
+    response: str
+    expires_at: float
+    size: int
+    context: str
+    grams: FrozenSet[str]
+    words: FrozenSet[str]
+
+
+class ResponseCache:
+    """
+    LRU + TTL cache of chat responses
+
+    Entries are keyed on the normalized message together with a context made
+    of the history fingerprint and the system prompt version, so a cached
+    answer is only reused for the same conversation state and prompt.
+
+    Lookups try an exact match first. If a similarity threshold is set, they
+    then fall back to the closest cached message (character-trigram Jaccard
+    similarity) within the same context that has exactly the same content
+    words and numbers, so a negation or a changed year or name never
+    matches however close the spelling.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 2 * 1024 * 1024,
+        ttl_seconds: float = 3600,
+        similarity_threshold: float = 0.0
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._contexts: Dict[str, Set[str]] = {}
+        self._bytes = 0
+
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        message: str,
+        conversation_history: List[Dict[str, str]],
+        prompt_version: str
+    ) -> Tuple[str, str, str]:
+        """
+        Build the cache key for a request
+
+        Returns:
+            (key, context, normalized message)
+        """
+        normalized = normalize_message(message)
+        context = f"{prompt_version}:{history_fingerprint(conversation_history)}"
+        return f"{context}:{normalized}", context, normalized
+
+    def get(
+        self,
+        message: str,
+        conversation_history: List[Dict[str, str]],
+        prompt_version: str
+    ) -> Optional[str]:
+        """Return a cached response for the request, or None on a miss"""
+        key, context, normalized = self.make_key(message, conversation_history, prompt_version)
+        now = time.monotonic()
+
+        entry = self._lookup(key, now)
+        if entry is not None:
+            self.hits += 1
+            return entry.response
+
+        if self.similarity_threshold > 0:
+            similar_key = self._find_similar(context, normalized, now)
+            if similar_key is not None:
+                entry = self._entries[similar_key]
+                self._entries.move_to_end(similar_key)
+                self.similar_hits += 1
+                return entry.response
+
+        self.misses += 1
+        return None
+
+    def set(
+        self,
+        message: str,
+        conversation_history: List[Dict[str, str]],
+        prompt_version: str,
+        response: str
+    ) -> None:
+        """Store a response, evicting least recently used entries past the caps"""
+        key, context, normalized = self.make_key(message, conversation_history, prompt_version)
+        size = len(key) + len(response)
+        if size > self.max_bytes:
+            return
+
+        self._remove(key)
+        self._entries[key] = _Entry(
+            response=response,
+            expires_at=time.monotonic() + self.ttl_seconds,
+            size=size,
+            context=context,
+            grams=_trigrams(normalized) if self.similarity_threshold > 0 else frozenset(),
+            words=content_words(normalized) if self.similarity_threshold > 0 else frozenset()
+        )
+        self._contexts.setdefault(context, set()).add(key)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+    def discard(
+        self,
+        message: str,
+        conversation_history: List[Dict[str, str]],
+        prompt_version: str
+    ) -> None:
+        """Drop the cached response for a request, if any"""
+        key, _, _ = self.make_key(message, conversation_history, prompt_version)
+        self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every cached response"""
+        self._entries.clear()
+        self._contexts.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters and current size"""
+        lookups = self.hits + self.similar_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.similar_hits) / lookups, 4) if lookups else 0.0
+        }
+
+    def _lookup(self, key: str, now: float) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _find_similar(self, context: str, normalized: str, now: float) -> Optional[str]:
+        candidates = self._contexts.get(context)
+        if not candidates:
+            return None
+
+        grams = _trigrams(normalized)
+        words = content_words(normalized)
+        best_key, best_score = None, self.similarity_threshold
+        for key in list(candidates):
+            entry = self._entries[key]
+            if entry.expires_at <= now:
+                self._remove(key)
+                continue
+            if entry.words != words:
+                continue
+            union = len(grams | entry.grams)
+            score = len(grams & entry.grams) / union if union else 0.0
+            if score >= best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        keys = self._contexts.get(entry.context)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._contexts[entry.context]
@@ -0,0 +1,147 @@
+"""
+Portfolio Retrieval - BM25 index over portfolio content
+Selects the portfolio sections relevant to a question so the prompt only
+carries what the model needs to answer it
+"""
+
+import re
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "did", "do", "does",
+    "for", "from", "has", "have", "how", "i", "in", "is", "it", "me", "my", "of",
+    "on", "or", "tell", "that", "the", "this", "to", "was", "what", "which",
+    "with", "you", "your", "about", "any", "some", "there", "their", "them",
+    "were", "who", "why", "when", "where", "he", "his", "him",
+})
+
+
+def _stem(token: str) -> str:
+    """Strip a plural 's' so projects matches project"""
+    if len(token) > 4 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, lightly stemmed word tokens with stopwords removed"""
+    return [_stem(token) for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token estimate (~4 characters per token)"""
+    return len(text) // 4 + 1
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """A retrievable section of the portfolio"""
+    kind: str
+    key: str
+    text: str
+    tokens: int
+
+
+def build_chunks(data: Dict) -> List[Chunk]:
+    """Split portfolio data into project, experience and testimonial chunks"""
+    chunks = []
+
+    for proj in data["projects"]:
+        text = (
+            f"PROJECT - {proj['title']}: {proj['fullDesc']}\n"
+            f"Features: {'; '.join(proj['features'])}\n"
+            f"Technologies: {', '.join(proj['tech'])}\n"
+            f"Highlights: {proj['highlights']}\n"
+            f"GitHub: {proj['github']}"
+        )
+        chunks.append(Chunk("project", str(proj["id"]), text, estimate_tokens(text)))
+
+    for exp in data["experience"]:
+        text = (
+            f"EXPERIENCE - {exp['role']} at {exp['company']} ({exp['period']}): {exp['description']}\n"
+            f"Achievements: {' '.join(exp['achievements'])}\n"
+            f"Technologies: {', '.join(exp['technologies'])}"
+        )
+        chunks.append(Chunk("experience", str(exp["id"]), text, estimate_tokens(text)))
+
+    for testimonial in data["testimonials"]:
+        text = (
+            f"TESTIMONIAL - {testimonial['name']}, {testimonial['role']} at "
+            f"{testimonial['company']}: \"{testimonial['text']}\""
+        )
+        chunks.append(Chunk("testimonial", str(testimonial["id"]), text, estimate_tokens(text)))
+
+    return chunks
+
+
+class PortfolioRetriever:
+    """
+    BM25 retriever over portfolio chunks
+
+    The inverted index is built once per portfolio version; queries only touch
+    the postings of their own terms.
+    """
+
+    def __init__(self, data: Dict, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.chunks = build_chunks(data)
+
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._doc_lengths: List[int] = []
+        for index, chunk in enumerate(self.chunks):
+            terms = Counter(tokenize(chunk.text))
+            self._doc_lengths.append(sum(terms.values()))
+            for term, freq in terms.items():
+                self._postings.setdefault(term, []).append((index, freq))
+
+        count = len(self.chunks)
+        self._avg_length = sum(self._doc_lengths) / count if count else 0.0
+        self._idf = {
+            term: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+
+    def score(self, query: str) -> List[Tuple[int, float]]:
+        """Return (chunk index, score) pairs for chunks matching the query, best first"""
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf[term]
+            for index, freq in postings:
+                norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[index] / self._avg_length)
+                scores[index] = scores.get(index, 0.0) + idf * freq * (self.k1 + 1) / (freq + norm)
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+    def retrieve(self, query: str, top_k: int = 4, token_budget: int = 1000) -> List[Chunk]:
+        """
+        Select the most relevant chunks for a query
+
+        Args:
+            query: Question text to match against
+            top_k: Maximum number of chunks to return
+            token_budget: Maximum estimated tokens across returned chunks
+
+        Returns:
+            Chunks in relevance order; chunks that would overflow the budget
+            are skipped in favour of smaller, lower-ranked ones
+        """
+        selected = []
+        remaining = token_budget
+        for index, _ in self.score(query):
+            chunk = self.chunks[index]
+            if chunk.tokens > remaining:
+                continue
+            selected.append(chunk)
+            remaining -= chunk.tokens
+            if len(selected) >= top_k:
+                break
+        return selected
@@ -0,0 +1,76 @@
+"""
+Production Server - Multi-worker entry point
+Runs the API in one uvicorn worker process per available core, with state
+that must agree across workers kept in a shared SQLite file
+
+Run from backend/:
+    python serve.py                  # WEB_CONCURRENCY workers, default one per core
+    python serve.py --workers 1      # single process, in-memory state
+"""
+
+import os
+import shutil
+import argparse
+import tempfile
+
+import uvicorn
+
+
+# On shutdown uvicorn stops accepting connections and waits this long for
+# open requests (streaming chats included) before cancelling them; the
+# pooled clients are closed afterwards in each worker's lifespan
+GRACEFUL_SHUTDOWN_TIMEOUT = int(os.environ.get("GRACEFUL_SHUTDOWN_TIMEOUT", "30"))
+
+
+def available_cores() -> int:
+    """Cores this process may run on (respects CPU affinity, e.g. in containers)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def default_workers() -> int:
+    """
+    Worker count: WEB_CONCURRENCY, or one per core
+
+    The app is I/O bound on an async event loop, so one process per core
+    already keeps every core busy; more workers only add memory and
+    duplicate per-worker caches and upstream connection pools.
+    """
+    configured = os.environ.get("WEB_CONCURRENCY")
+    if configured:
+        return max(1, int(configured))
+    return available_cores()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=default_workers())
+    args = parser.parse_args()
+
+    state_dir = None
+    if args.workers > 1 and not os.environ.get("SHARED_STATE_PATH"):
+        # Workers inherit the environment, so they all open the same file. It
+        # lives in a fresh directory only this user can enter (mkdtemp uses
+        # mode 0700), not at a predictable path other local users could plant
+        state_dir = tempfile.mkdtemp(prefix="portfolio-api-")
+        os.environ["SHARED_STATE_PATH"] = os.path.join(state_dir, "shared.db")
+
+    try:
+        uvicorn.run(
+            "main:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_TIMEOUT
+        )
+    finally:
+        if state_dir is not None:
+            shutil.rmtree(state_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+Chat Sessions - Server-side conversation history
+Clients send a session id and the new message instead of the whole
+conversation; turns are kept pre-tokenized in a bounded LRU/TTL store with
+optional SQLite persistence, which worker processes can share
+"""
+
+import os
+import json
+import time
+import asyncio
+import secrets
+import sqlite3
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from history import role_content, summarize_turns
+from retrieval import estimate_tokens
+from shared_state import SQLiteDatabase
+
+logger = logging.getLogger(__name__)
+
+
+SESSION_MAX_SESSIONS = int(os.environ.get("SESSION_MAX_SESSIONS", "10000"))
+SESSION_TTL = float(os.environ.get("SESSION_TTL", str(2 * 3600)))
+SESSION_MAX_TURNS = int(os.environ.get("SESSION_MAX_TURNS", "50"))
+SESSION_SUMMARY_CHARS = 400
+# Earlier questions remembered once their turns are dropped
+SESSION_EARLIER_QUESTIONS = 8
+# Empty disables persistence; sessions then live only in this process
+SESSION_DB_PATH = os.environ.get("SESSION_DB_PATH", "")
+
+
+@dataclass(frozen=True)
+class Turn:
+    """One stored message with its token estimate computed once"""
+    role: str
+    content: str
+    tokens: int
+
+    @classmethod
+    def of(cls, role: str, content: str) -> "Turn":
+        return cls(role, content, estimate_tokens(content))
+
+
+@dataclass
+class Session:
+    """
+    A conversation's stored turns
+
+    Turns beyond SESSION_MAX_TURNS are dropped and only the visitor's last
+    few questions from them are kept, so a session's size stays bounded.
+    """
+    id: str
+    turns: List[Turn] = field(default_factory=list)
+    earlier_questions: List[str] = field(default_factory=list)
+    updated_at: float = field(default_factory=time.time)
+    _summary: Optional[Turn] = field(default=None, repr=False)
+
+    def history(self) -> List[Turn]:
+        """Turns in the format accepted by compact_history, oldest first"""
+        if not self.earlier_questions:
+            return list(self.turns)
+        if self._summary is None:
+            questions = [Turn.of("user", question) for question in self.earlier_questions]
+            self._summary = Turn.of("system", summarize_turns(questions, SESSION_SUMMARY_CHARS))
+        return [self._summary] + self.turns
+
+    def append(self, user_message: str, assistant_message: str, max_turns: int = SESSION_MAX_TURNS) -> None:
+        self.turns.append(Turn.of("user", user_message))
+        self.turns.append(Turn.of("assistant", assistant_message))
+        self.updated_at = time.time()
+
+        overflow = len(self.turns) - max_turns
+        if overflow > 0:
+            dropped, self.turns = self.turns[:overflow], self.turns[overflow:]
+            questions = self.earlier_questions + [
+                " ".join(turn.content.split())[:120] for turn in dropped if turn.role == "user"
+            ]
+            self.earlier_questions = questions[-SESSION_EARLIER_QUESTIONS:]
+            self._summary = None
+
+    def to_row(self) -> tuple:
+        turns = json.dumps([[turn.role, turn.content] for turn in self.turns], ensure_ascii=False)
+        earlier = json.dumps(self.earlier_questions, ensure_ascii=False)
+        return (self.id, self.updated_at, earlier, turns)
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "Session":
+        session_id, updated_at, earlier, turns = row
+        return cls(
+            id=session_id,
+            turns=[Turn.of(role, content) for role, content in json.loads(turns)],
+            earlier_questions=json.loads(earlier),
+            updated_at=updated_at
+        )
+
+
+class SQLiteSessionBackend:
+    """Write-through persistence of sessions to a local SQLite file"""
+
+    def __init__(self, db: SQLiteDatabase):
+        self.db = db
+        with db.transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "id TEXT PRIMARY KEY, updated_at REAL NOT NULL, earlier TEXT NOT NULL, turns TEXT NOT NULL)"
+            )
+
+    def load(self, session_id: str, ttl: float) -> Optional[Session]:
+        with self.db.reading() as conn:
+            row = conn.execute(
+                "SELECT id, updated_at, earlier, turns FROM sessions WHERE id = ? AND updated_at >= ?",
+                (session_id, time.time() - ttl)
+            ).fetchone()
+        return Session.from_row(row) if row else None
+
+    def save(self, session: Session) -> None:
+        with self.db.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (id, updated_at, earlier, turns) VALUES (?, ?, ?, ?)",
+                session.to_row()
+            )
+
+    def purge(self, ttl: float) -> int:
+        """Delete sessions idle for longer than ttl seconds"""
+        with self.db.transaction() as conn:
+            return conn.execute(
+                "DELETE FROM sessions WHERE updated_at < ?", (time.time() - ttl,)
+            ).rowcount
+
+    def close(self) -> None:
+        self.db.close()
+
+
+class SessionStore:
+    """
+    LRU + idle-TTL store of chat sessions
+
+    The most recently used sessions are held in memory. With a backend, every
+    update is written through and sessions evicted from memory (or lost on
+    restart) are reloaded from it on their next turn. A shared backend is
+    also written by other workers, so it is read first on every turn and the
+    in-memory copy only serves sessions not yet persisted.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = SESSION_MAX_SESSIONS,
+        ttl_seconds: float = SESSION_TTL,
+        backend: Optional[SQLiteSessionBackend] = None,
+        shared: bool = False
+    ):
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.backend = backend
+        self.shared = shared and backend is not None
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self.created = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self, seed_history: Sequence[Any] = ()) -> Session:
+        """
+        Start a new session
+
+        Args:
+            seed_history: Messages (dicts or Message models) sent by a client
+                that does not use sessions yet
+        """
+        session = Session(id=secrets.token_urlsafe(16))
+        for msg in seed_history[-SESSION_MAX_TURNS:]:
+            role, content = role_content(msg)
+            session.turns.append(Turn.of(role, content))
+        self._put(session)
+        self.created += 1
+        return session
+
+    async def get(self, session_id: str) -> Optional[Session]:
+        """Return a live session, loading it from the backend if needed"""
+        if self.shared:
+            session = await self._load(session_id)
+            if session is not None:
+                return session
+
+        session = self._sessions.get(session_id)
+        if session is not None:
+            if time.time() - session.updated_at <= self.ttl_seconds:
+                self._sessions.move_to_end(session_id)
+                return session
+            del self._sessions[session_id]
+            return None
+
+        if self.backend is None or self.shared:
+            return None
+        return await self._load(session_id)
+
+    async def _load(self, session_id: str) -> Optional[Session]:
+        try:
+            session = await asyncio.to_thread(self.backend.load, session_id, self.ttl_seconds)
+        except sqlite3.Error as e:
+            logger.error("Failed to load session: %s", e)
+            return None
+        if session is not None:
+            self._put(session)
+        return session
+
+    async def save(self, session: Session) -> None:
+        """Persist a session after its turns changed"""
+        self._put(session)
+        if self.backend is not None:
+            try:
+                await asyncio.to_thread(self.backend.save, session)
+            except sqlite3.Error as e:
+                logger.error("Failed to persist session: %s", e)
+
+    def _put(self, session: Session) -> None:
+        self._sessions[session.id] = session
+        self._sessions.move_to_end(session.id)
+        self._evict()
+
+    def _evict(self) -> None:
+        # Least recently used first; expired sessions at the front go too
+        now = time.time()
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if len(self._sessions) <= self.max_sessions and now - oldest.updated_at <= self.ttl_seconds:
+                break
+            self._sessions.popitem(last=False)
+            self.evicted += 1
+
+    def close(self) -> None:
+        if self.backend is not None:
+            self.backend.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sessions": len(self._sessions),
+            "created": self.created,
+            "evicted": self.evicted,
+            "persistent": self.backend is not None,
+            "shared": self.shared
+        }
+
+
+def create_session_store(shared_db: Optional[SQLiteDatabase] = None) -> SessionStore:
+    """
+    Build the session store from the environment
+
+    Args:
+        shared_db: Database shared by all worker processes; takes precedence
+            over SESSION_DB_PATH so every worker sees every session
+    """
+    db = shared_db or (SQLiteDatabase(SESSION_DB_PATH) if SESSION_DB_PATH else None)
+    if db is None:
+        return SessionStore()
+    backend = SQLiteSessionBackend(db)
+    purged = backend.purge(SESSION_TTL)
+    if purged:
+        logger.info("Purged %d expired sessions from %s", purged, db.path)
+    return SessionStore(backend=backend, shared=shared_db is not None)
@@ -0,0 +1,140 @@
+"""
+Shared State - Cross-process state on a local SQLite file
+Lets several worker processes share rate limits, sessions and computed
+answers; each process opens its own connection on first use
+"""
+
+import os
+import json
+import time
+import asyncio
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+
+T = TypeVar("T")
+
+# Set (e.g. by serve.py for multi-worker runs) to share state through this
+# SQLite file; empty keeps all state in process memory
+SHARED_STATE_PATH = os.environ.get("SHARED_STATE_PATH", "")
+
+
+class SQLiteDatabase:
+    """
+    A SQLite file used from async code
+
+    The connection is opened lazily and re-opened in a forked child, so an
+    instance created at import time (e.g. under gunicorn --preload) never
+    shares a connection across processes. Calls are serialized on a lock and
+    run in worker threads via run().
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 5.0):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            # Autocommit mode; transaction() issues BEGIN IMMEDIATE itself
+            conn = sqlite3.connect(
+                self.path, timeout=self.busy_timeout, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Hold the write lock for a read-modify-write across processes
+
+        BEGIN IMMEDIATE takes SQLite's reserved lock up front, so two workers
+        can't both read a row and then overwrite each other's update.
+        """
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @contextmanager
+    def reading(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            yield self._connection()
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a blocking database call off the event loop"""
+        return await asyncio.to_thread(fn, *args)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+class SharedCache:
+    """
+    Key/value entries with expiry, visible to every process on the file
+
+    Values are stored as JSON text, so anything able to write the file can
+    at worst plant wrong answers, never run code in the workers.
+    """
+
+    def __init__(self, db: SQLiteDatabase, table: str = "shared_cache"):
+        self.db = db
+        self.table = table
+        with db.transaction() as conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def get_sync(self, key: str) -> Optional[Any]:
+        with self.db.reading() as conn:
+            row = conn.execute(
+                f"SELECT value FROM {self.table} WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            # Written in another format (e.g. by an older version); treat as a miss
+            return None
+
+    def set_sync(self, key: str, value: Any, ttl_seconds: float) -> None:
+        text = json.dumps(value, ensure_ascii=False)
+        with self.db.transaction() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, text, time.time() + ttl_seconds)
+            )
+            conn.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),))
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self.db.run(self.get_sync, key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        await self.db.run(self.set_sync, key, value, ttl_seconds)
+
+
+def open_shared_state(path: str = SHARED_STATE_PATH) -> Optional[SQLiteDatabase]:
+    """Return the shared database if SHARED_STATE_PATH is configured"""
+    if not path:
+        return None
+    logger.info("Sharing rate limits, sessions and answers through %s", path)
+    return SQLiteDatabase(path)
@@ -0,0 +1,65 @@
+"""
+Single-Flight - Request coalescing for identical in-flight calls
+Concurrent callers with the same key share one underlying call
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent async calls by key
+
+    The first caller for a key starts the call as a task; callers arriving
+    while it is running await the same task. Results and exceptions are
+    delivered to every waiter. A waiter being cancelled does not cancel the
+    shared call unless it was the last one waiting for it.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn() for key, or join the call already in flight for it"""
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            self.started += 1
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if not call.task.done() and call.waiters == 1:
+                # Last interested caller left; stop the shared call and make
+                # sure new callers start a fresh one
+                self._forget(key, call)
+                call.task.cancel()
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _forget(self, key: str, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
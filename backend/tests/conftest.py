@@ -0,0 +1,77 @@
+"""
+Test configuration - run from backend/ with `python -m pytest`
+"""
+
+import os
+import sys
+import types
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Modules are imported flat, as uvicorn does from backend/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Keep app imports side-effect free: no file watcher, no upstream key
+os.environ.setdefault("CONTENT_WATCH", "0")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.pop("GROQ_API_KEY", None)
+
+# A cross-origin frontend, as in production
+ORIGIN = "https://portfolio.example.com"
+
+
+@pytest.fixture
+def client():
+    """TestClient for the app, with its lifespan running"""
+    import main
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture
+def origin_headers():
+    return {"Origin": ORIGIN}
+
+
+class FakeGroq:
+    """
+    Stands in for the Groq client
+
+    chat.completions.create records its keyword arguments and delegates to
+    `handler`, an async callable the test assigns.
+    """
+
+    def __init__(self):
+        self.handler = None
+        self.calls = []
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        return await self.handler(**kwargs)
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """
+    Point the app's AI service at a FakeGroq client
+
+    The service gets a key, a fresh router, breaker and response cache, and a
+    single upstream attempt per call so failures don't wait on backoff.
+    """
+    import main
+    import ai_service
+    from model_router import ModelRouter
+    from resilience import CircuitBreaker
+    from response_cache import ResponseCache
+
+    fake = FakeGroq()
+    service = main.ai_service
+    monkeypatch.setattr(service, "api_key", "test-key")
+    monkeypatch.setattr(service, "_client", fake)
+    monkeypatch.setattr(service, "router", ModelRouter())
+    monkeypatch.setattr(service, "breaker", CircuitBreaker())
+    monkeypatch.setattr(service, "response_cache", ResponseCache())
+    monkeypatch.setattr(ai_service, "GROQ_RETRY_ATTEMPTS", 1)
+    return fake
@@ -0,0 +1,176 @@
+"""
+Admission control - slot accounting and limit adaptation
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from admission import AdmissionController, AdmissionMiddleware, Overloaded
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def scope(path):
+    return {"type": "http", "method": "POST", "path": path, "headers": []}
+
+
+def streaming_app(first_chunk_delay, total):
+    """ASGI app sending its first chunk after one delay and finishing after another"""
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await asyncio.sleep(first_chunk_delay)
+        await send({"type": "http.response.body", "body": b"a", "more_body": True})
+        await asyncio.sleep(total - first_chunk_delay)
+        await send({"type": "http.response.body", "body": b"b", "more_body": False})
+    return app
+
+
+async def call(middleware, path):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await middleware(scope(path), receive, send)
+
+
+def test_service_time_stays_below_client_timeout():
+    controller = AdmissionController(latency_target=5, client_timeout=30)
+    controller.latency = 150.0
+    assert controller.service_time < controller.client_timeout
+    assert controller.client_timeout - controller.service_time > 0
+
+
+def test_streams_adapt_on_time_to_first_byte():
+    controller = AdmissionController(latency_target=0.1, client_timeout=30)
+    middleware = AdmissionMiddleware(streaming_app(0.01, 0.2), controller, {"/stream": 0})
+    run(call(middleware, "/stream"))
+    assert controller.in_flight == 0
+    assert controller.latency < 0.1
+
+
+def test_unmeasured_routes_do_not_adapt():
+    controller = AdmissionController(latency_target=0.01, client_timeout=30)
+    middleware = AdmissionMiddleware(
+        streaming_app(0.05, 0.05), controller, {"/batch": 1}, unmeasured=("/batch",)
+    )
+    limit = controller.limit
+    run(call(middleware, "/batch"))
+    assert controller.in_flight == 0
+    assert controller.latency is None
+    assert controller.limit == limit
+
+
+def test_queued_request_is_shed_at_its_deadline():
+    async def scenario():
+        controller = AdmissionController(initial_limit=1, min_limit=1, latency_target=0.05, client_timeout=0.2)
+        await controller.acquire()
+        with pytest.raises(Overloaded) as shed:
+            await controller.acquire()
+        return controller, shed.value
+
+    controller, shed = run(scenario())
+    assert shed.reason == "deadline"
+    assert (controller.in_flight, controller.queued) == (1, 0)
+
+
+def test_request_is_shed_up_front_when_it_cannot_make_the_deadline():
+    async def scenario():
+        # Each slot is held ~1s: one queued request could start within 2.5s, a second could not
+        controller = AdmissionController(initial_limit=1, min_limit=1, latency_target=1, client_timeout=2.5)
+        await controller.acquire()
+        queued = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        with pytest.raises(Overloaded) as shed:
+            await controller.acquire()
+        queued.cancel()
+        await asyncio.gather(queued, return_exceptions=True)
+        return controller, shed.value
+
+    controller, shed = run(scenario())
+    assert shed.reason == "expected_wait"
+    assert (controller.in_flight, controller.queued) == (1, 0)
+
+
+def test_slots_go_to_waiters_by_priority():
+    async def scenario():
+        controller = AdmissionController(initial_limit=1, min_limit=1, latency_target=0.05, client_timeout=5)
+        await controller.acquire()
+        order = []
+
+        async def wait(priority, name):
+            await controller.acquire(priority)
+            order.append(name)
+
+        batch = asyncio.create_task(wait(1, "batch"))
+        await asyncio.sleep(0)
+        chat = asyncio.create_task(wait(0, "chat"))
+        await asyncio.sleep(0)
+        controller.release(None)
+        await chat
+        controller.release(None)
+        await batch
+        return order
+
+    assert run(scenario()) == ["chat", "batch"]
+
+
+def test_cancelled_waiter_hands_its_slot_on():
+    async def scenario():
+        controller = AdmissionController(initial_limit=1, min_limit=1, latency_target=0.05, client_timeout=5)
+        await controller.acquire()
+        first = asyncio.create_task(controller.acquire())
+        second = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        # The slot is handed to `first`, whose client goes away before it runs
+        controller.release(None)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await asyncio.wait_for(second, timeout=1)
+        return controller
+
+    controller = run(scenario())
+    assert (controller.in_flight, controller.queued) == (1, 0)
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def scenario():
+        controller = AdmissionController(initial_limit=1, min_limit=1, latency_target=0.05, client_timeout=5)
+        await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        controller.release(None)
+        return controller
+
+    controller = run(scenario())
+    assert (controller.in_flight, controller.queued) == (0, 0)
+
+
+def test_admission_time_is_stamped_after_the_queue_wait():
+    async def scenario():
+        controller = AdmissionController(initial_limit=1, min_limit=1, latency_target=1, client_timeout=30)
+        seen = {}
+
+        async def app(scope, receive, send):
+            seen["admitted_at"] = scope["state"]["admitted_at"]
+
+        middleware = AdmissionMiddleware(app, controller, {"/chat": 0})
+        await controller.acquire()
+        request = asyncio.create_task(call(middleware, "/chat"))
+        await asyncio.sleep(0.05)
+        released_at = time.perf_counter()
+        controller.release(None)
+        await request
+        return seen["admitted_at"], released_at
+
+    admitted_at, released_at = run(scenario())
+    assert admitted_at >= released_at
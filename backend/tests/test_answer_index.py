@@ -0,0 +1,71 @@
+"""
+Answer index - suggested questions and their precomputed answers
+"""
+
+from answer_index import AnswerIndex, generate_suggested_questions
+
+DATA = {
+    "projects": [
+        {"title": "Rainfall Forecasting", "tech": ["Python", "TensorFlow"]},
+        {"title": "Result Portal", "tech": ["React", "python"]},
+        {"title": "Stock Predictor", "tech": ["Python", "React"]},
+    ],
+    "experience": [
+        {"role": "Data Analyst", "company": "Acme"},
+        {"role": "Intern", "company": "Initech"},
+    ],
+}
+
+
+def test_questions_mix_top_technologies_projects_and_latest_role():
+    assert generate_suggested_questions(DATA) == [
+        "What projects have you built with Python?",
+        "Tell me about the Rainfall Forecasting project",
+        "What did you work on as Data Analyst at Acme?",
+        "What projects have you built with React?",
+        "Tell me about the Result Portal project",
+        "What technologies are you most proficient in?",
+    ]
+
+
+def test_question_limit_keeps_the_general_question_last():
+    questions = generate_suggested_questions(DATA, limit=3)
+    assert len(questions) == 3
+    assert questions[-1] == "What technologies are you most proficient in?"
+
+
+def test_sparse_content_still_yields_questions():
+    questions = generate_suggested_questions({"projects": [], "experience": []})
+    assert questions == ["What technologies are you most proficient in?"]
+
+
+def test_lookup_matches_the_normalized_question_exactly():
+    index = AnswerIndex()
+    index.reset("v1", ["What projects have you built with Python?"])
+    assert index.put("What projects have you built with Python?", "v1", "Three of them.")
+    assert index.get("what projects have you built with python", "v1") == "Three of them."
+    assert index.get("What projects have you built with Python lately?", "v1") is None
+    assert index.hits == 1
+
+
+def test_other_versions_never_match():
+    index = AnswerIndex()
+    index.reset("v1", ["Question?"])
+    index.put("Question?", "v1", "Answer")
+    assert index.get("Question?", "v2") is None
+
+
+def test_reset_drops_answers_and_rejects_stale_ones():
+    index = AnswerIndex()
+    index.reset("v1", ["Question?"])
+    index.put("Question?", "v1", "Old answer")
+    index.mark_refreshed("v1")
+
+    index.reset("v2", ["Question?"])
+    assert len(index) == 0
+    assert index.refreshed_at is None
+    # An answer computed from the old prompt arrives after the reset
+    assert not index.put("Question?", "v1", "Old answer")
+    assert index.get("Question?", "v2") is None
+    index.mark_refreshed("v1")
+    assert index.refreshed_at is None
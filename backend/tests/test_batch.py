@@ -0,0 +1,34 @@
+"""
+Batch answers - upstream failures are errors, not fallback answers
+"""
+
+import asyncio
+
+import pytest
+
+import main
+
+QUESTION = "Which design decision in the forecasting pipeline would you revisit?"
+
+
+@pytest.fixture
+def failing_upstream(upstream):
+    async def create(**kwargs):
+        raise asyncio.TimeoutError()
+
+    upstream.handler = create
+    return upstream
+
+
+def test_batch_reports_upstream_failure_as_error(failing_upstream):
+    async def collect():
+        return [answer async for answer in main.ai_service.answer_batch([QUESTION])]
+
+    [answer] = asyncio.run(collect())
+    assert answer.response is None
+    assert answer.error.startswith("AI service unavailable")
+
+
+def test_chat_still_falls_back(failing_upstream):
+    response = asyncio.run(main.ai_service.get_ai_response(QUESTION, []))
+    assert response == main.ai_service.build_fallback_response(QUESTION)
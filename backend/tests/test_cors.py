@@ -0,0 +1,33 @@
+"""
+HTTP caching middleware - memoized bodies keep CORS headers; self-cached routes bypass the memo
+"""
+
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("path", [
+    "/api/portfolio-data",
+    "/api/portfolio-data/projects",
+    "/api/suggested-questions",
+    "/api/projects/rainfall-forecasting-ai",
+    "/api/experience/1",
+])
+def test_memoized_responses_carry_cors_headers(client, origin_headers, path):
+    main.response_memo.clear()
+    for _ in range(2):  # miss, then memo hit
+        response = client.get(path, headers={**origin_headers, "Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert "Origin" in response.headers["vary"]
+
+
+def test_self_cached_route_skips_the_memo(client):
+    main.response_memo.clear()
+    misses = main.response_memo.misses
+    first = client.get("/api/portfolio-data")
+    second = client.get("/api/portfolio-data", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 304
+    assert main.response_memo.misses == misses
+    assert len(main.response_memo) == 0
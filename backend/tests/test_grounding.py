@@ -0,0 +1,32 @@
+"""
+Grounding - entity extraction from answers
+"""
+
+from grounding import COMPANY, PROJECT, GroundingIndex
+
+DATA = {
+    "bio": {"summary": "Data scientist who has worked at Acme Analytics since 2021."},
+    "projects": [{"title": "Stock Price Predictor", "tech": ["Python", "Node.js"]}],
+    "experience": [{"company": "Acme Analytics", "period": "2021 - Present"}],
+    "skills": {"languages": ["Python", "SQL"]},
+}
+
+
+def test_company_names_stop_at_sentence_end():
+    report = GroundingIndex(DATA).check("He worked at Acme Analytics. His focus was forecasting.")
+    assert report.grounded, report.ungrounded
+
+
+def test_run_does_not_join_next_sentence():
+    report = GroundingIndex(DATA).check("He is good at SQL. Look at His Stock Price Predictor project.")
+    assert report.grounded, report.ungrounded
+
+
+def test_dotted_names_stay_whole():
+    report = GroundingIndex(DATA).check("The frontend was built at Node.js Labs.")
+    assert (COMPANY, "node.js labs") in report.ungrounded
+
+
+def test_unknown_project_is_ungrounded():
+    report = GroundingIndex(DATA).check("He built the Weather Bot App project.")
+    assert (PROJECT, "weather bot app") in report.ungrounded
@@ -0,0 +1,69 @@
+"""
+Conversation history - token-budgeted compaction
+"""
+
+from history import MIN_TRUNCATED_TOKENS, compact_history, summarize_turns
+from retrieval import estimate_tokens
+from sessions import Turn
+
+
+def message(role, content):
+    return {"role": role, "content": content}
+
+
+def test_history_within_budget_is_kept_whole():
+    history = [message("user", "Hi"), message("assistant", "Hello!")]
+    assert compact_history(history, token_budget=100) == history
+
+
+def test_oldest_turns_are_dropped_and_summarized():
+    history = [
+        message("user", "What is your main stack?"),
+        message("assistant", "a" * 400),
+        message("user", "Which project used React?"),
+        message("assistant", "b" * 40),
+    ]
+    budget = estimate_tokens(history[2]["content"]) + estimate_tokens(history[3]["content"])
+    compacted = compact_history(history, token_budget=budget)
+
+    assert compacted[1:] == history[2:]
+    summary = compacted[0]
+    assert summary["role"] == "system"
+    assert "What is your main stack?" in summary["content"]
+    assert "Which project used React?" not in summary["content"]
+
+
+def test_partially_fitting_message_is_truncated_from_the_end():
+    history = [message("user", "Tell me about the forecasting project. " + "x" * 2000)]
+    budget = MIN_TRUNCATED_TOKENS + 10
+    [truncated] = compact_history(history, token_budget=budget)
+
+    assert truncated["content"].startswith("Tell me about the forecasting project.")
+    assert truncated["content"].endswith("...")
+    assert estimate_tokens(truncated["content"]) <= budget
+
+
+def test_compacted_history_stays_within_budget():
+    history = [message("user" if i % 2 == 0 else "assistant", f"Turn {i} " + "y" * 300) for i in range(40)]
+    compacted = compact_history(history, token_budget=500, summary_chars=200)
+    turns = compacted[1:]
+    assert compacted[0]["role"] == "system" and len(compacted[0]["content"]) <= 200
+    assert sum(estimate_tokens(msg["content"]) for msg in turns) <= 500
+    assert turns[-1] == history[-1]
+
+
+def test_stored_token_estimates_are_used():
+    # A session turn claims more tokens than its text suggests, so it doesn't fit
+    turn = Turn("user", "short", tokens=1000)
+    compacted = compact_history([turn], token_budget=MIN_TRUNCATED_TOKENS - 1)
+    assert compacted[0]["role"] == "system"
+    assert len(compacted) == 1
+
+
+def test_summary_lists_questions_and_is_capped():
+    turns = [message("user", f"Question number {i}?") for i in range(50)] + [message("assistant", "Answer")]
+    summary = summarize_turns(turns, max_chars=120)
+    assert summary.startswith("Earlier in this conversation the visitor asked: Question number 0?")
+    assert summary.endswith("...")
+    assert len(summary) <= 120
+    assert "Answer" not in summary
@@ -0,0 +1,32 @@
+"""
+Portfolio index - technology lookups
+"""
+
+import pytest
+
+from portfolio_index import PortfolioIndex, normalize_tech
+
+
+@pytest.mark.parametrize("name", ["React", "react.js", "React.js", " React  JS ", "REACT"])
+def test_normalize_tech_ignores_js_suffix(name):
+    assert normalize_tech(name) == "react"
+
+
+def test_normalize_tech_keeps_other_names():
+    assert normalize_tech("Scikit-Learn") == "scikit-learn"
+    assert normalize_tech(".js") == ".js"
+
+
+def test_projects_using_matches_aliases_once():
+    index = PortfolioIndex({
+        "projects": [
+            {"id": 1, "tech": ["React.js", "React", "FastAPI"]},
+            {"id": 2, "tech": ["react"]},
+            {"id": 3, "tech": ["Vue.js"]},
+        ],
+        "experience": [],
+        "skills": {},
+    })
+    assert [proj["id"] for proj in index.projects_using("React")] == [1, 2]
+    assert [proj["id"] for proj in index.projects_using("react.js")] == [1, 2]
+    assert index.projects_using("Angular") == ()
@@ -0,0 +1,67 @@
+"""
+Answers are filed under the prompt version they were generated from
+"""
+
+import asyncio
+import types
+
+import pytest
+
+import main
+
+QUESTION = "What would you change about the forecasting model's feature pipeline?"
+NEW_VERSION = "reloaded-during-the-call"
+
+
+def completion(text):
+    message = types.SimpleNamespace(content=text)
+    return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)], usage=None)
+
+
+class Stream:
+    def __init__(self, text):
+        self.text = text
+
+    async def __aiter__(self):
+        delta = types.SimpleNamespace(content=self.text)
+        yield types.SimpleNamespace(choices=[types.SimpleNamespace(delta=delta)], x_groq=None)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def reloading_upstream(upstream, monkeypatch):
+    """The content reloads (the prompt version changes) while the upstream call is in flight"""
+    service = main.ai_service
+    monkeypatch.setattr(service, "prompt_version", "before-reload")
+    jobs = []
+    monkeypatch.setattr(service.grounding, "submit", jobs.append)
+
+    async def create(stream=False, **kwargs):
+        service.prompt_version = NEW_VERSION
+        return Stream("Answer") if stream else completion("Answer")
+
+    upstream.handler = create
+    upstream.jobs = jobs
+    return upstream
+
+
+def assert_filed_under_old_version(jobs):
+    cache = main.ai_service.response_cache
+    assert cache.get(QUESTION, [], "before-reload") == "Answer"
+    assert cache.get(QUESTION, [], NEW_VERSION) is None
+    assert [job.version for job in jobs] == ["before-reload"]
+
+
+def test_answer_is_cached_under_the_version_it_was_looked_up_with(reloading_upstream):
+    assert asyncio.run(main.ai_service.get_ai_response(QUESTION, [])) == "Answer"
+    assert_filed_under_old_version(reloading_upstream.jobs)
+
+
+def test_streamed_answer_is_cached_under_the_version_it_was_looked_up_with(reloading_upstream):
+    async def collect():
+        return "".join([token async for token in main.ai_service.stream_ai_response(QUESTION, [])])
+
+    assert asyncio.run(collect()) == "Answer"
+    assert_filed_under_old_version(reloading_upstream.jobs)
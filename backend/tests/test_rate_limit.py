@@ -0,0 +1,69 @@
+"""
+Token bucket rate limiting, in memory and shared through SQLite
+"""
+
+import asyncio
+
+import pytest
+
+from rate_limit import InMemoryRateLimiter, SQLiteRateLimiter
+from shared_state import SQLiteDatabase
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_limiter(request, tmp_path):
+    def make(capacity, window_seconds):
+        if request.param == "memory":
+            return InMemoryRateLimiter(capacity, window_seconds)
+        return SQLiteRateLimiter(SQLiteDatabase(str(tmp_path / "state.db")), capacity, window_seconds)
+    return make
+
+
+def hits(limiter, key, count):
+    async def scenario():
+        return [await limiter.hit(key) for _ in range(count)]
+    return asyncio.run(scenario())
+
+
+def test_burst_up_to_capacity_then_limited(make_limiter):
+    results = hits(make_limiter(3, 60), "client", 4)
+    assert [result.allowed for result in results] == [True, True, True, False]
+    assert [result.remaining for result in results[:3]] == [2, 1, 0]
+    # One token refills every 20 seconds
+    assert 19 < results[3].retry_after <= 20
+
+
+def test_keys_have_separate_buckets(make_limiter):
+    limiter = make_limiter(1, 60)
+    assert hits(limiter, "a", 1)[0].allowed
+    assert hits(limiter, "b", 1)[0].allowed
+    assert not hits(limiter, "a", 1)[0].allowed
+
+
+def test_tokens_refill_over_time(make_limiter):
+    limiter = make_limiter(1, 0.05)
+    assert hits(limiter, "client", 1)[0].allowed
+    assert not hits(limiter, "client", 1)[0].allowed
+    asyncio.run(asyncio.sleep(0.06))
+    assert hits(limiter, "client", 1)[0].allowed
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_idle_buckets_are_swept(backend, tmp_path):
+    if backend == "memory":
+        limiter = InMemoryRateLimiter(2, 0.01, sweep_interval=0)
+    else:
+        limiter = SQLiteRateLimiter(SQLiteDatabase(str(tmp_path / "state.db")), 2, 0.01, sweep_interval=0)
+    hits(limiter, "client", 1)
+    assert len(limiter) == 1
+    asyncio.run(asyncio.sleep(0.02))
+    hits(limiter, "other", 1)
+    assert len(limiter) == 1
+
+
+def test_shared_key_count_is_read_without_querying(tmp_path):
+    """len() feeds a gauge rendered on the event loop, so it must not touch the database"""
+    limiter = SQLiteRateLimiter(SQLiteDatabase(str(tmp_path / "state.db")), 2, 60, sweep_interval=0)
+    hits(limiter, "client", 1)
+    limiter.db = None
+    assert len(limiter) == 1
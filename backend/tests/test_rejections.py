@@ -0,0 +1,41 @@
+"""
+Rejections by the middleware stack (413, 429, 503) carry CORS headers
+"""
+
+import main
+from rate_limit import InMemoryRateLimiter
+
+CHAT = {"message": "What projects has he built?", "conversation_history": []}
+
+
+def assert_cors(response):
+    assert response.headers["access-control-allow-origin"] == "*"
+
+
+def test_oversized_body(client, origin_headers):
+    response = client.post(
+        "/api/chat",
+        content=b"x" * (main.MAX_CHAT_BODY_BYTES + 1),
+        headers={**origin_headers, "Content-Type": "application/json"}
+    )
+    assert response.status_code == 413
+    assert_cors(response)
+
+
+def test_rate_limited(client, origin_headers, monkeypatch):
+    monkeypatch.setattr(main, "rate_limiter", InMemoryRateLimiter(1, 60))
+    client.post("/api/chat", json=CHAT, headers=origin_headers)
+    response = client.post("/api/chat", json=CHAT, headers=origin_headers)
+    assert response.status_code == 429
+    assert "Retry-After" in response.headers
+    assert_cors(response)
+
+
+def test_shed_by_admission(client, origin_headers, monkeypatch):
+    monkeypatch.setattr(main, "rate_limiter", InMemoryRateLimiter(100, 60))
+    monkeypatch.setattr(main.admission, "limit", 0.0)
+    monkeypatch.setattr(main.admission, "max_queue", 0)
+    response = client.post("/api/chat", json=CHAT, headers=origin_headers)
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+    assert_cors(response)
@@ -0,0 +1,84 @@
+"""
+Circuit breaker states and retry policy
+"""
+
+import asyncio
+
+import pytest
+
+from resilience import CircuitBreaker, call_with_retries
+
+
+def open_breaker(reset_timeout: float) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=reset_timeout)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_half_open_lets_one_trial_through():
+    breaker = open_breaker(reset_timeout=0)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+
+def test_trial_success_closes():
+    breaker = open_breaker(reset_timeout=0)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+def test_trial_failure_reopens():
+    breaker = open_breaker(reset_timeout=0)
+    assert breaker.allow()
+    breaker.reset_timeout = 60
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_release_frees_the_trial_without_an_outcome():
+    breaker = open_breaker(reset_timeout=0)
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+
+def test_retries_transient_errors_until_success():
+    attempts = 0
+
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise asyncio.TimeoutError()
+        return "ok"
+
+    assert asyncio.run(call_with_retries(flaky, attempts=3, base_delay=0.001)) == "ok"
+    assert attempts == 3
+
+
+def test_does_not_retry_permanent_errors():
+    attempts = 0
+
+    async def broken():
+        nonlocal attempts
+        attempts += 1
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        asyncio.run(call_with_retries(broken, attempts=3, base_delay=0.001, is_transient=lambda e: False))
+    assert attempts == 1
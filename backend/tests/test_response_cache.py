@@ -0,0 +1,92 @@
+"""
+Response cache - exact and similar hits, expiry and eviction
+"""
+
+import time
+
+import pytest
+
+from response_cache import ResponseCache
+
+HISTORY = [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello!"}]
+
+
+def test_exact_hit_ignores_case_and_punctuation():
+    cache = ResponseCache()
+    cache.set("What projects use React?", [], "v1", "Two of them.")
+    assert cache.get("what projects use react", [], "v1") == "Two of them."
+    assert cache.stats()["hits"] == 1
+
+
+def test_hits_are_scoped_to_history_and_prompt_version():
+    cache = ResponseCache()
+    cache.set("What projects use React?", [], "v1", "Two of them.")
+    assert cache.get("What projects use React?", HISTORY, "v1") is None
+    assert cache.get("What projects use React?", [], "v2") is None
+    assert cache.stats()["misses"] == 2
+
+
+def test_similarity_tier_is_off_by_default():
+    cache = ResponseCache()
+    cache.set("Tell me about your React projects", [], "v1", "answer")
+    assert cache.get("Tell me about the React projects", [], "v1") is None
+
+
+def test_similar_hit_with_the_same_content_words():
+    cache = ResponseCache(similarity_threshold=0.6)
+    cache.set("Tell me about your React projects", [], "v1", "answer")
+    assert cache.get("Tell me about the React projects", [], "v1") == "answer"
+    assert cache.stats()["similar_hits"] == 1
+
+
+# The threshold is low enough that character trigrams alone would match each
+# pair; the content-word check is what keeps them apart
+@pytest.mark.parametrize("cached, asked", [
+    ("Did you use FastAPI in your projects?", "Did you not use FastAPI in your projects?"),
+    ("What did you build in 2025?", "What did you build in 2024?"),
+    ("Tell me about the AI project", "Tell me about the API project"),
+])
+def test_near_misses_are_not_similar_hits(cached, asked):
+    cache = ResponseCache(similarity_threshold=0.6)
+    cache.set(cached, [], "v1", "answer")
+    assert cache.get(asked, [], "v1") is None
+    assert cache.stats()["similar_hits"] == 0
+
+
+def test_entries_expire():
+    cache = ResponseCache(ttl_seconds=0.01)
+    cache.set("What projects use React?", [], "v1", "Two of them.")
+    time.sleep(0.02)
+    assert cache.get("What projects use React?", [], "v1") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.set("first", [], "v1", "1")
+    cache.set("second", [], "v1", "2")
+    assert cache.get("first", [], "v1") == "1"
+    cache.set("third", [], "v1", "3")
+    assert cache.get("second", [], "v1") is None
+    assert cache.get("first", [], "v1") == "1"
+    assert cache.get("third", [], "v1") == "3"
+
+
+def test_byte_cap_evicts_and_rejects_oversized_entries():
+    cache = ResponseCache(max_bytes=200)
+    cache.set("first", [], "v1", "x" * 80)
+    cache.set("second", [], "v1", "y" * 80)
+    assert cache.get("first", [], "v1") is None
+    assert cache.get("second", [], "v1") == "y" * 80
+    assert cache.stats()["bytes"] <= 200
+
+    cache.set("huge", [], "v1", "z" * 500)
+    assert cache.get("huge", [], "v1") is None
+    assert cache.get("second", [], "v1") == "y" * 80
+
+
+def test_discard_removes_an_entry():
+    cache = ResponseCache()
+    cache.set("What projects use React?", [], "v1", "Two of them.")
+    cache.discard("what projects use react", [], "v1")
+    assert cache.get("What projects use React?", [], "v1") is None
@@ -0,0 +1,91 @@
+"""
+Chat sessions - eviction, overflow summary and SQLite persistence
+"""
+
+import asyncio
+import time
+
+from sessions import Session, SessionStore, SQLiteSessionBackend
+from shared_state import SQLiteDatabase
+
+
+def test_least_recently_used_session_is_evicted():
+    store = SessionStore(max_sessions=2)
+    first, second = store.create(), store.create()
+    assert asyncio.run(store.get(first.id)) is first
+    third = store.create()
+    assert asyncio.run(store.get(second.id)) is None
+    assert asyncio.run(store.get(first.id)) is first
+    assert asyncio.run(store.get(third.id)) is third
+    assert store.evicted == 1
+
+
+def test_idle_sessions_expire():
+    store = SessionStore(ttl_seconds=60)
+    session = store.create()
+    session.updated_at = time.time() - 61
+    assert asyncio.run(store.get(session.id)) is None
+    assert len(store) == 0
+
+
+def test_seed_history_is_stored_as_turns():
+    store = SessionStore()
+    session = store.create([
+        {"role": "user", "content": "Hi"},
+        {"role": "assistant", "content": "Hello!"},
+    ])
+    assert [(turn.role, turn.content) for turn in session.history()] == [("user", "Hi"), ("assistant", "Hello!")]
+    assert all(turn.tokens > 0 for turn in session.turns)
+
+
+def test_overflowing_turns_are_summarized_as_earlier_questions():
+    session = Session(id="s")
+    for i in range(4):
+        session.append(f"Question {i}", f"Answer {i}", max_turns=4)
+
+    assert [turn.content for turn in session.turns] == ["Question 2", "Answer 2", "Question 3", "Answer 3"]
+    assert session.earlier_questions == ["Question 0", "Question 1"]
+    summary, *turns = session.history()
+    assert summary.role == "system"
+    assert "Question 0" in summary.content and "Question 1" in summary.content
+    assert turns == session.turns
+
+
+def test_sessions_round_trip_through_sqlite(tmp_path):
+    backend = SQLiteSessionBackend(SQLiteDatabase(str(tmp_path / "sessions.db")))
+    session = Session(id="s")
+    for i in range(3):
+        session.append(f"Question {i} – ünïcode", f"Answer {i}", max_turns=4)
+    backend.save(session)
+
+    loaded = backend.load("s", ttl=60)
+    assert loaded.turns == session.turns
+    assert loaded.earlier_questions == session.earlier_questions
+    assert loaded.updated_at == session.updated_at
+    assert backend.load("missing", ttl=60) is None
+
+
+def test_evicted_sessions_are_reloaded_from_the_backend(tmp_path):
+    backend = SQLiteSessionBackend(SQLiteDatabase(str(tmp_path / "sessions.db")))
+    store = SessionStore(max_sessions=1, backend=backend)
+
+    async def scenario():
+        first = store.create()
+        first.append("Question", "Answer")
+        await store.save(first)
+        store.create()  # evicts the first from memory
+        return first, await store.get(first.id)
+
+    first, reloaded = asyncio.run(scenario())
+    assert reloaded is not first
+    assert reloaded.turns == first.turns
+
+
+def test_expired_sessions_are_purged_from_the_backend(tmp_path):
+    backend = SQLiteSessionBackend(SQLiteDatabase(str(tmp_path / "sessions.db")))
+    stale = Session(id="stale", updated_at=time.time() - 120)
+    backend.save(stale)
+    backend.save(Session(id="live"))
+    assert backend.load("stale", ttl=60) is None
+    assert backend.purge(ttl=60) == 1
+    assert backend.load("live", ttl=60) is not None
@@ -0,0 +1,24 @@
+"""
+Shared state - values round-trip as JSON and foreign rows are misses
+"""
+
+from shared_state import SharedCache, SQLiteDatabase
+
+
+def test_values_round_trip(tmp_path):
+    cache = SharedCache(SQLiteDatabase(str(tmp_path / "state.db")))
+    cache.set_sync("answer", "Built with React.js — and FastAPI", 60)
+    cache.set_sync("ids", [1, "two"], 60)
+    assert cache.get_sync("answer") == "Built with React.js — and FastAPI"
+    assert cache.get_sync("ids") == [1, "two"]
+    assert cache.get_sync("missing") is None
+
+
+def test_expired_and_undecodable_entries_are_misses(tmp_path):
+    db = SQLiteDatabase(str(tmp_path / "state.db"))
+    cache = SharedCache(db)
+    cache.set_sync("old", "stale", -1)
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO shared_cache VALUES ('pickled', ?, 1e12)", (b"\x80\x04\x95",))
+    assert cache.get_sync("old") is None
+    assert cache.get_sync("pickled") is None
@@ -0,0 +1,95 @@
+"""
+Single-flight - sharing, error propagation and cancellation
+"""
+
+import asyncio
+
+import pytest
+
+from singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+        return flight, calls, results
+
+    flight, calls, results = asyncio.run(scenario())
+    assert calls == 1
+    assert results == ["answer"] * 5
+    assert (flight.started, flight.coalesced, len(flight)) == (1, 4, 0)
+
+
+def test_errors_reach_every_waiter_and_are_not_cached():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream down")
+
+        results = await asyncio.gather(flight.do("key", fail), flight.do("key", fail), return_exceptions=True)
+        retry = await flight.do("key", lambda: asyncio.sleep(0, result="recovered"))
+        return results, retry
+
+    results, retry = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert retry == "recovered"
+
+
+def test_cancelling_one_waiter_keeps_the_shared_call():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "answer"
+
+        first = asyncio.create_task(flight.do("key", fetch))
+        second = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return first, await second
+
+    first, result = asyncio.run(scenario())
+    assert first.cancelled()
+    assert result == "answer"
+
+
+def test_cancelling_the_last_waiter_cancels_the_call():
+    async def scenario():
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        # A new caller starts a fresh call instead of joining the cancelled one
+        fresh = await flight.do("key", lambda: asyncio.sleep(0, result="fresh"))
+        return flight, fresh
+
+    flight, fresh = asyncio.run(scenario())
+    assert fresh == "fresh"
+    assert flight.started == 2
@@ -0,0 +1,45 @@
+"""
+Streamed answers - client disconnects are not upstream failures
+"""
+
+import asyncio
+import types
+
+import main
+
+
+class FakeStream:
+    def __init__(self):
+        self.closed = False
+
+    def __aiter__(self):
+        return self.chunks()
+
+    async def chunks(self):
+        for text in ("Hel", "lo ", "world"):
+            await asyncio.sleep(0)
+            delta = types.SimpleNamespace(content=text)
+            yield types.SimpleNamespace(choices=[types.SimpleNamespace(delta=delta)], x_groq=None)
+
+    async def close(self):
+        self.closed = True
+
+
+def test_client_disconnect_is_not_recorded_against_the_model(upstream):
+    service = main.ai_service
+    stream = FakeStream()
+
+    async def create(**kwargs):
+        return stream
+
+    upstream.handler = create
+
+    async def disconnect_after_first_token():
+        tokens = service.stream_ai_response("Walk me through the tradeoffs of a design you regret", [])
+        assert await tokens.__anext__()
+        await tokens.aclose()
+
+    asyncio.run(disconnect_after_first_token())
+    assert stream.closed
+    assert all(stats.samples == 0 for stats in service.router.stats.values())
+    assert service.breaker.state == service.breaker.CLOSED
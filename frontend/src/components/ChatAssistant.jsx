@@ -1,6 +1,6 @@
 import React, { useState, useEffect, useRef } from 'react';
 import { MessageCircle, X, Send, Loader, Sparkles, Trash2 } from 'lucide-react';
-import { sendChatMessage, getSuggestedQuestions } from '../services/api';
+import { streamChatMessage, getSuggestedQuestions } from '../services/api';
 
 const ChatAssistant = () => {
   const [isOpen, setIsOpen] = useState(false);
@@ -9,6 +9,7 @@ const ChatAssistant = () => {
   const [isLoading, setIsLoading] = useState(false);
   const [suggestedQuestions, setSuggestedQuestions] = useState([]);
   const [error, setError] = useState(null);
+  const [sessionId, setSessionId] = useState(null);
   
   const messagesEndRef = useRef(null);
   const inputRef = useRef(null);
@@ -46,15 +47,27 @@ const ChatAssistant = () => {
     setError(null);
 
     try {
-      const history = messages.map(msg => ({ role: msg.role, content: msg.content }));
-      const response = await sendChatMessage(textToSend, history);
-      
-      const aiMessage = { 
-        role: 'assistant', 
-        content: response.response,
-        timestamp: response.timestamp
+      // Append an empty assistant message and fill it in as tokens arrive
+      setMessages(prev => [...prev, { role: 'assistant', content: '', isStreaming: true }]);
+      const updateLastMessage = (update) => {
+        setMessages(prev => {
+          const next = [...prev];
+          next[next.length - 1] = { ...next[next.length - 1], ...update(next[next.length - 1]) };
+          return next;
+        });
       };
-      setMessages(prev => [...prev, aiMessage]);
+
+      // Only the new message is sent; the server keeps the history for this session
+      const response = await streamChatMessage(textToSend, sessionId, {
+        onToken: (token) => updateLastMessage(last => ({ content: last.content + token })),
+      });
+
+      updateLastMessage(() => ({
+        content: response.response,
+        timestamp: response.timestamp,
+        isStreaming: false
+      }));
+      setSessionId(response.session_id);
 
       if (response.suggested_questions && messages.length === 0) {
         setSuggestedQuestions(response.suggested_questions);
@@ -62,7 +75,7 @@ const ChatAssistant = () => {
     } catch (error) {
       console.error('Error sending message:', error);
       setError(error.message || 'Failed to send message. Please try again.');
-      setMessages(prev => [...prev, {
+      setMessages(prev => [...prev.filter(msg => !msg.isStreaming), {
         role: 'assistant',
         content: 'Sorry, I encountered an error. Please try again or check your connection.',
         isError: true
@@ -79,6 +92,7 @@ const ChatAssistant = () => {
   const clearConversation = () => {
     if (window.confirm('Clear all messages?')) {
       setMessages([]);
+      setSessionId(null);
       setError(null);
     }
   };
@@ -153,7 +167,7 @@ const ChatAssistant = () => {
               </div>
             )}
 
-            {messages.map((message, index) => (
+            {messages.map((message, index) => message.content && (
               <div key={index} className={`flex ${message.role === 'user' ? 'justify-end' : 'justify-start'}`}>
                 <div className={`max-w-[80%] px-4 py-3 rounded-2xl ${
                     message.role === 'user'
@@ -167,7 +181,7 @@ const ChatAssistant = () => {
               </div>
             ))}
 
-            {isLoading && (
+            {isLoading && !messages[messages.length - 1]?.content && (
               <div className="flex justify-start">
                 <div className="bg-gray-900 border border-gray-800 px-4 py-3 rounded-2xl flex items-center gap-2">
                   <Loader size={16} className="animate-spin" />
@@ -63,13 +63,13 @@ export const fetchPortfolioData = async () => {
 /**
  * Send a chat message to the AI assistant
  * @param {string} message - User's message
- * @param {Array} conversationHistory - Previous conversation messages
+ * @param {string|null} sessionId - Session id from the previous response (history is kept server-side)
  */
-export const sendChatMessage = async (message, conversationHistory = []) => {
+export const sendChatMessage = async (message, sessionId = null) => {
   try {
     const response = await api.post('/api/chat', {
       message,
-      conversation_history: conversationHistory,
+      session_id: sessionId,
     });
     return response.data;
   } catch (error) {
@@ -86,6 +86,72 @@ export const sendChatMessage = async (message, conversationHistory = []) => {
   }
 };
 
+/**
+ * Stream a chat response from the AI assistant as it is generated
+ * @param {string} message - User's message
+ * @param {string|null} sessionId - Session id from the previous response (history is kept server-side)
+ * @param {Object} handlers - { onToken(text), signal } callbacks/options
+ * @returns {Object} The final ChatResponse payload, including session_id
+ */
+export const streamChatMessage = async (message, sessionId = null, { onToken, signal } = {}) => {
+  const response = await fetch(new URL('/api/chat/stream', API_BASE_URL), {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({
+      message,
+      session_id: sessionId,
+    }),
+    signal,
+  });
+
+  if (response.status === 429) {
+    throw new Error('Too many requests. Please wait a moment and try again.');
+  } else if (!response.ok) {
+    const body = await response.json().catch(() => ({}));
+    throw new Error(body.detail || 'Failed to send message. Please try again.');
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let finalPayload = null;
+
+  // Parse server-sent event frames separated by a blank line
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const frame = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      let event = 'message';
+      let data = '';
+      for (const line of frame.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data += line.slice(6);
+      }
+      if (!data) continue;
+
+      const payload = JSON.parse(data);
+      if (event === 'token') {
+        onToken?.(payload.content);
+      } else if (event === 'done') {
+        finalPayload = payload;
+      } else if (event === 'error') {
+        throw new Error(payload.detail);
+      }
+    }
+  }
+
+  if (!finalPayload) {
+    throw new Error('Connection closed before the response completed.');
+  }
+  return finalPayload;
+};
+
 /**
  * Get suggested questions for the chat
  */